@@ -1,9 +1,37 @@
 import os
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from functools import lru_cache
 from web3 import Web3
 
-@dataclass
+
+# Values below are validated once, when the module is imported, and used as Config defaults.
+
+VALID_ANALYSIS_MODES = ('privado', 'civic', 'worldid')
+
+_ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "privado").lower()
+if _ANALYSIS_MODE not in VALID_ANALYSIS_MODES:
+    print(f"Warning: Invalid ANALYSIS_MODE '{_ANALYSIS_MODE}'. Defaulting to 'privado'.")
+    _ANALYSIS_MODE = 'privado'
+
+_CANON_NULL_ADDRESS = os.getenv("NULL_ADDRESS", "0x0000000000000000000000000000000000000000")
+if _CANON_NULL_ADDRESS:
+    try:
+        # Web3.to_checksum_address is a static helper, no need for a throwaway Web3() instance
+        _CANON_NULL_ADDRESS = Web3.to_checksum_address(_CANON_NULL_ADDRESS)
+    except Exception as e:
+        print(f"Warning: Could not checksum NULL_ADDRESS '{_CANON_NULL_ADDRESS}': {e}. Using as is.")
+
+_METHODS_TO_FILTER = os.getenv("METHODS_TO_FILTER")
+
+VALID_RESULTS_FORMATS = ('csv', 'parquet')
+
+_RESULTS_FORMAT = os.getenv("RESULTS_FORMAT", "csv").lower()
+if _RESULTS_FORMAT not in VALID_RESULTS_FORMATS:
+    print(f"Warning: Invalid RESULTS_FORMAT '{_RESULTS_FORMAT}'. Defaulting to 'csv'.")
+    _RESULTS_FORMAT = 'csv'
+
+
+@dataclass(frozen=True)
 class Config:
     """
     Configuration class for blockchain analytics script.
@@ -12,7 +40,7 @@ class Config:
     """
     # Analysis mode: 'privado', 'civic', or 'worldid'
     # Environment variable: ANALYSIS_MODE (e.g., "privado", "civic", or "worldid")
-    analysis_mode: str = os.getenv("ANALYSIS_MODE", "privado").lower() # Default to 'privado'
+    analysis_mode: str = _ANALYSIS_MODE # Default to 'privado'
 
     # RPC URL for the blockchain network (e.g., Polygon, Ethereum)
     # Environment variable: RPC_URL
@@ -34,16 +62,47 @@ class Config:
     # Environment variable: CONTRACT_ADDRESS
     contract_address: str | None = os.getenv("CONTRACT_ADDRESS")
 
-    # List of method names to filter transactions by from the CSV 'Method' column (optional)
+    # Tuple of method names to filter transactions by from the CSV 'Method' column (optional)
     # If empty or None, no method filtering is applied based on CSV column.
     # Relevant for all modes, but Civic, if you want to pre-filter the CSV.
     # Environment variable: METHODS_TO_FILTER (comma-separated string, e.g., "Method1,Method2")
-    methods_to_filter: List[str] = field(default_factory=lambda: os.getenv("METHODS_TO_FILTER", "").split(',') if os.getenv("METHODS_TO_FILTER") else [])
+    methods_to_filter: tuple[str, ...] = tuple(
+        method.strip() for method in _METHODS_TO_FILTER.split(',') if method.strip()
+    ) if _METHODS_TO_FILTER else ()
 
-    # Maximum number of concurrent workers for fetching data
+    # Size of the connection pool of the synchronous Web3 client (used for the connection check)
     # Environment variable: MAX_WORKERS (integer string, e.g., "10")
     max_workers: int = int(os.getenv("MAX_WORKERS", "6"))
 
+    # Number of JSON-RPC calls sent in a single batched HTTP request
+    # Environment variable: RPC_BATCH_SIZE (integer string, e.g., "100")
+    rpc_batch_size: int = int(os.getenv("RPC_BATCH_SIZE", "100"))
+
+    # Maximum number of batched RPC requests in flight at once while prefetching
+    # transactions and blocks (all of them share one aiohttp connection pool)
+    # Environment variable: MAX_CONCURRENCY (integer string, e.g., "16")
+    max_concurrency: int = int(os.getenv("MAX_CONCURRENCY", "16"))
+
+    # File format of the per-transaction results: 'csv' or 'parquet'
+    # Parquet keeps typed columns and is written in row groups of 10,000 results.
+    # Environment variable: RESULTS_FORMAT (e.g., "csv" or "parquet")
+    results_format: str = _RESULTS_FORMAT # Default to 'csv'
+
+    # Flag to fetch block timestamps of transactions whose input did not decode ('privado' and 'worldid' modes).
+    # By default their blocks are skipped and their results have no timestamp.
+    # Environment variable: ALWAYS_FETCH_TIMESTAMP ("True" or "False")
+    always_fetch_timestamp: bool = os.getenv("ALWAYS_FETCH_TIMESTAMP", "False").lower() == "true"
+
+    # Directory of the on-disk cache of mined transactions, receipts and block timestamps,
+    # which lets re-runs skip the RPC calls already made. Entries are kept per RPC URL and
+    # are never evicted, so delete the directory to reclaim space. Disabled when empty (the default).
+    # Environment variable: RPC_CACHE_DIR (e.g., ".cache")
+    rpc_cache_dir: str = os.getenv("RPC_CACHE_DIR", "")
+
+    # Flag to ignore cached RPC responses and fetch everything again (the cache is still updated)
+    # Environment variable: FORCE_REFRESH ("True" or "False")
+    force_refresh: bool = os.getenv("FORCE_REFRESH", "False").lower() == "true"
+
     # Flag to indicate if Proof-of-Authority middleware should be applied
     # Set to "True" or "False" in environment variables
     # Environment variable: APPLY_POA_MIDDLEWARE ("True" or "False")
@@ -52,7 +111,7 @@ class Config:
     # Address representing the null address for minting events (ERC-721 standard)
     # Relevant for 'civic' mode.
     # Environment variable: NULL_ADDRESS (defaults to Ethereum zero address)
-    null_address: str = os.getenv("NULL_ADDRESS", "0x0000000000000000000000000000000000000000")
+    null_address: str = _CANON_NULL_ADDRESS
 
     # Specific method name for identity creation in Privado ID mode
     # Environment variable: PRIVADO_GENESIS_METHOD (e.g., "transitState")
@@ -63,18 +122,13 @@ class Config:
     worldid_register_method: str = os.getenv("WORLDID_REGISTER_METHOD", "registerIdentities")
 
 
-    def __post_init__(self):
-        self.methods_to_filter = [method.strip() for method in self.methods_to_filter if method.strip()]
-        if self.null_address:
-             try:
-                 w3_temp = Web3()
-                 self.null_address = w3_temp.to_checksum_address(self.null_address)
-             except Exception as e:
-                 print(f"Warning: Could not checksum NULL_ADDRESS '{self.null_address}': {e}. Using as is.")
 
-        valid_modes = ['privado', 'civic', 'worldid']
-        if self.analysis_mode not in valid_modes:
-            print(f"Warning: Invalid ANALYSIS_MODE '{self.analysis_mode}'. Defaulting to 'privado'.")
-            self.analysis_mode = 'privado'
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Returns the process-wide Config instance.
+    Environment variables are parsed and validated once, when this module is imported.
+    """
+    return Config()
 
 
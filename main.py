@@ -1,53 +1,150 @@
 from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
+from web3.types import TxData, TxReceipt
 from hexbytes import HexBytes
-from typing import Dict, Any, List, Optional, Union
+from eth_utils import to_checksum_address
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import os
+import re
 import time
+import numpy as np
 import pandas as pd
-import concurrent.futures
 import argparse
 
-from config import Config
-from src.tx_details import decode_transaction_input
+from config import get_config
+from src.rpc import (
+    get_w3,
+    batch_get_transactions,
+    batch_get_block_timestamps,
+    batch_get_blocks_with_transactions,
+    batch_get_receipts
+)
+from src.rpc_async import RpcCallError, close_sessions
+from src.rpc_cache import RpcCache
+from src.transactions_csv import read_transactions_csv
+from src.tx_details import decode_many, load_contract_abi, load_selector_table, target_selectors
 from src.output import (
-    plot_privado_decoding_success,
-    plot_privado_genesis_cumulative,
-    plot_privado_genesis_daily,
-    plot_privado_identity_frequency_bubble_chart,
-    plot_civic_minting_success,
-    plot_civic_cumulative_minted_tokens_over_time,
-    plot_civic_daily_minted_tokens,
-    plot_civic_recipient_address_frequency_bubble_chart,
-    plot_worldid_decoding_success,
-    plot_worldid_registrations_cumulative,
-    plot_worldid_registrations_daily,
-    save_results_csv
+    build_results_df,
+    generate_mode_graphics,
+    ResultsCsvWriter,
+    ResultsParquetWriter
 )
 
-config = Config()
+config = get_config()
+
+# dtype of every result field, in output column order
+RESULT_FIELD_DTYPES: Dict[str, Any] = {
+    "transaction_hash": object,
+    "timestamp": np.int64,
+    "decoded_function": object,
+    "decoded_parameters": object,
+    "is_genesis_transition": bool,
+    "is_worldid_registration": bool,
+    "privado_decoding_successful": bool,
+    "worldid_decoding_successful": bool,
+    "is_minting_event": bool,
+    "recipient_address": object,
+    "token_id": object,
+    "civic_log_processing_successful": bool,
+    "error": object,
+}
+
+# result field that counts as a successful outcome in each analysis mode
+SUCCESS_FIELD_BY_MODE: Dict[str, str] = {
+    "privado": "privado_decoding_successful",
+    "worldid": "worldid_decoding_successful",
+    "civic": "is_minting_event",
+}
+
+
+def allocate_result_columns(hex_hash_strings: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Preallocates one array per result field, with one row per transaction hash.
+
+    Timestamps are stored as int64 next to a 'has_timestamp' mask, since NumPy
+    integer arrays have no missing value.
+
+    Args:
+        hex_hash_strings: Transaction hash strings, in processing order.
+
+    Returns:
+        Dictionary mapping each result field name to its preallocated array.
+    """
+    row_count = len(hex_hash_strings)
+    result_columns: Dict[str, np.ndarray] = {
+        name: np.full(row_count, None, dtype=object) if dtype is object else np.zeros(row_count, dtype=dtype)
+        for name, dtype in RESULT_FIELD_DTYPES.items()
+    }
+    result_columns["transaction_hash"][:] = hex_hash_strings
+    result_columns["has_timestamp"] = np.zeros(row_count, dtype=bool)
+    return result_columns
+
+
+def store_result(result_columns: Dict[str, np.ndarray], index: int, result: Dict[str, Any]) -> None:
+    """Writes a task result into row 'index' of the preallocated result columns."""
+    for name in RESULT_FIELD_DTYPES:
+        if name == "timestamp":
+            if result["timestamp"] is not None:
+                result_columns["timestamp"][index] = result["timestamp"]
+                result_columns["has_timestamp"][index] = True
+        else:
+            result_columns[name][index] = result[name]
+
+
+def result_row(result_columns: Dict[str, np.ndarray], index: int) -> Dict[str, Any]:
+    """Reads row 'index' of the result columns back into a result dictionary."""
+    row = {name: result_columns[name][index] for name in RESULT_FIELD_DTYPES}
+    if not result_columns["has_timestamp"][index]:
+        row["timestamp"] = None
+    return row
+
+
+
+# error marker of calls to non-target methods, whose parameters are not decoded;
+# they count as neither successful nor failed decodes
+DECODE_SKIPPED_ERROR = "Parameters not decoded (not a target method)"
+
+# a transaction hash as written by block explorers: 0x followed by 32 bytes in hex
+TRANSACTION_HASH_PATTERN = re.compile(r"0x[0-9a-fA-F]{64}")
+
+# topic of the ERC-721 Transfer event, hashed once instead of once per transaction
+TRANSFER_EVENT_TOPIC = bytes(Web3.keccak(text="Transfer(address,address,uint256)"))
+
+
+def address_topic(address: str) -> bytes:
+    """Returns an address as an indexed event topic: 20 address bytes left-padded to 32 bytes."""
+    return bytes(12) + bytes(HexBytes(address))
+
 
 def process_transaction_task(
-    w3: Web3,
     hex_hash_string: str,
-    contract_abi: list,
+    tx: Optional[TxData],
+    block_timestamp: Optional[int],
+    decoded_input: Optional[Tuple[str, Optional[Dict[str, Any]]]],
+    receipt: Optional[TxReceipt],
     contract_address_from_config: Optional[str],
-    null_address: str, # needed for Civic mode
+    null_address_topic: bytes, # needed for Civic mode
     analysis_mode: str,
     privado_genesis_method: str,
     worldid_register_method: str,
     verbose: bool
 ) -> Dict[str, Any]:
     """
-    Task function to fetch transaction, get timestamp, and process based on analysis mode.
+    Task function to process a prefetched transaction and its block timestamp based on analysis mode.
 
     Args:
-        w3: Web3 client.
         hex_hash_string: Transaction hash string.
-        contract_abi: Contract ABI relevant to the analysis mode.
+        tx: The transaction fetched by batch_get_transactions, or None if it was not found.
+        block_timestamp: Timestamp of the transaction's block, prefetched once per unique block,
+            or None if the block could not be fetched.
+        decoded_input: The (function name, parameters) decoded from the transaction input by the
+            decoding process pool, or None if decoding failed or was not run ('civic' mode).
+            Parameters are None for non-target methods, which are identified by selector only.
+        receipt: The receipt fetched by batch_get_receipts in 'civic' mode, or None otherwise
+            or if it could not be fetched.
         contract_address_from_config: The contract address specified in config (optional).
-        null_address: The configured null address (0x0...0), used in 'civic' mode.
+        null_address_topic: The configured null address (0x0...0) as an event topic, see address_topic.
+            Used in 'civic' mode.
         analysis_mode: The selected analysis mode ('privado', 'civic', or 'worldid').
         privado_genesis_method: The configured method name for Privado genesis.
         worldid_register_method: The configured method name for World ID registration.
@@ -73,10 +170,7 @@ def process_transaction_task(
         "civic_log_processing_successful": False,
         "error": None
     }
-    tx_hash_bytes = HexBytes(hex_hash_string)
-
     try:
-        tx = w3.eth.get_transaction(tx_hash_bytes)
         if tx is None:
             result_entry["error"] = "Transaction not found"
             if verbose:
@@ -90,20 +184,13 @@ def process_transaction_task(
                  print(f"\nWarning: Transaction {hex_hash_string} is pending (no block number). Cannot get timestamp.")
              return result_entry
 
-        try:
-            block = w3.eth.get_block(block_number)
-            timestamp = block.get('timestamp')
-            if timestamp is None:
-                 result_entry["error"] = "Block found but no timestamp"
-                 if verbose:
-                     print(f"\nError: Block {block_number} for transaction {hex_hash_string} has no timestamp.")
-                 return result_entry
-            result_entry["timestamp"] = timestamp
-        except Exception as e:
-             result_entry["error"] = f"Error fetching block or timestamp: {e}"
+        # without always_fetch_timestamp, blocks of undecoded inputs are not fetched in the decoding modes
+        if block_timestamp is None and (analysis_mode == 'civic' or decoded_input is not None):
+             result_entry["error"] = "Error fetching block or timestamp"
              if verbose:
-                 print(f"\nError fetching block {block_number} for transaction {hex_hash_string}: {e}")
+                 print(f"\nError: Could not get timestamp of block {block_number} for transaction {hex_hash_string}.")
              return result_entry
+        result_entry["timestamp"] = block_timestamp
 
         address_for_mode_processing = contract_address_from_config if contract_address_from_config else tx.get('to')
 
@@ -117,14 +204,14 @@ def process_transaction_task(
         # --- Process based on Analysis Mode ---
         if analysis_mode == 'privado':
             # Privado ID Mode: decode input data and check for genesis transition
-            input_data = tx.get('input')
-            input_data_for_decoding: Union[HexBytes, str, None] = input_data
-
-            decoded_data = decode_transaction_input(w3, input_data_for_decoding, contract_abi, address_for_mode_processing, verbose)
+            decoded_data = decoded_input
 
             if decoded_data:
                 function_name, parameters = decoded_data
                 result_entry["decoded_function"] = function_name
+                if parameters is None:
+                    result_entry["error"] = DECODE_SKIPPED_ERROR
+                    return result_entry
                 result_entry["decoded_parameters"] = parameters
                 result_entry["privado_decoding_successful"] = True
 
@@ -138,14 +225,14 @@ def process_transaction_task(
 
         elif analysis_mode == 'worldid':
             # World ID Mode: decode input data and check for registration method
-            input_data = tx.get('input')
-            input_data_for_decoding: Union[HexBytes, str, None] = input_data
-
-            decoded_data = decode_transaction_input(w3, input_data_for_decoding, contract_abi, address_for_mode_processing, verbose)
+            decoded_data = decoded_input
 
             if decoded_data:
                 function_name, parameters = decoded_data
                 result_entry["decoded_function"] = function_name
+                if parameters is None:
+                    result_entry["error"] = DECODE_SKIPPED_ERROR
+                    return result_entry
                 result_entry["decoded_parameters"] = parameters
                 result_entry["worldid_decoding_successful"] = True # Specific success flag for World ID decoding
 
@@ -159,16 +246,20 @@ def process_transaction_task(
         elif analysis_mode == 'civic':
             # Civic Mode: process event logs to find minting events
             try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash_bytes)
-                transfer_event_signature = w3.keccak(text="Transfer(address,address,uint256)").hex()
+                if receipt is None:
+                    result_entry["error"] = "Transaction receipt not found"
+                    if verbose:
+                        print(f"\nError: Receipt of transaction {hex_hash_string} not found.")
+                    return result_entry
+
+                # compare raw topic bytes, so only the emitted recipient address is converted and checksummed
                 for log in receipt["logs"]:
-                    if log['topics'][0].hex() == transfer_event_signature:
-                        from_address = w3.to_checksum_address(log['topics'][1].hex()[-40:])
-                        if from_address == null_address:
-                            result_entry["is_minting_event"] = True
-                            result_entry["civic_log_processing_successful"] = True
-                            result_entry["recipient_address"] = w3.to_checksum_address(log['topics'][2].hex()[-40:])
-                            result_entry["token_id"] = int(log['topics'][3].hex(), 16)
+                    topics = log['topics']
+                    if topics[0] == TRANSFER_EVENT_TOPIC and topics[1] == null_address_topic:
+                        result_entry["is_minting_event"] = True
+                        result_entry["civic_log_processing_successful"] = True
+                        result_entry["recipient_address"] = to_checksum_address(topics[2][-20:])
+                        result_entry["token_id"] = int.from_bytes(topics[3], 'big')
 
                 if not result_entry["is_minting_event"]:
                      result_entry["error"] = result_entry.get("error", "No minting event found in logs")
@@ -219,11 +310,9 @@ def run_analytics(verbose: bool = False):
     assert config.rpc_url is not None, "rpc_url must be set after config validation"
 
     try:
-        w3 = Web3(Web3.HTTPProvider(config.rpc_url))
-        if config.apply_poa_middleware:
-             w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-             if verbose:
-                 print("Applied Geth POA middleware.")
+        w3 = get_w3(config.rpc_url, config.apply_poa_middleware, config.max_workers)
+        if config.apply_poa_middleware and verbose:
+             print("Applied Geth POA middleware.")
 
         if not w3.is_connected():
             print(f"Error: Failed to connect to network at {config.rpc_url}. Check RPC_URL.")
@@ -233,40 +322,50 @@ def run_analytics(verbose: bool = False):
         print(f"Error connecting to Web3 provider at {config.rpc_url}: {e}")
         return
 
-    transactions_to_process_df: pd.DataFrame = pd.DataFrame()
+    transaction_hashes: pd.Series = pd.Series(dtype=str)
+    csv_block_numbers: set = set()
     try:
-        df = pd.read_csv(config.transactions_csv_path, index_col=False)
+        csv_columns = pd.read_csv(config.transactions_csv_path, nrows=0).columns
 
-        if 'Transaction Hash' not in df.columns:
+        if 'Transaction Hash' not in csv_columns:
             print(f"Error: CSV file '{config.transactions_csv_path}' does not contain a 'Transaction Hash' column.")
             return
-        if config.analysis_mode != 'civic' and 'Method' not in df.columns:
+        if config.analysis_mode != 'civic' and 'Method' not in csv_columns:
              print(f"Error: CSV file '{config.transactions_csv_path}' does not contain a 'Method' column.")
              return
 
+        # only the hash, method and block columns are used, so the remaining columns of wide exports are never parsed
+        df = read_transactions_csv(
+            config.transactions_csv_path,
+            [column for column in ('Transaction Hash', 'Method', 'Blockno') if column in csv_columns]
+        )
+
+        # drop missing and repeated hashes first, in place, so the filter runs on unique rows only
+        # (a transaction has a single method, so deduplicating before filtering keeps the same hashes)
+        loaded_row_count = len(df)
+        df.dropna(subset=['Transaction Hash'], inplace=True)
+        df.drop_duplicates(subset=['Transaction Hash'], inplace=True)
+        deduplicated_row_count = len(df)
+
+        print(f"Loaded {loaded_row_count} transactions from {config.transactions_csv_path}.")
+        if loaded_row_count > deduplicated_row_count:
+            print(f"Removed {loaded_row_count - deduplicated_row_count} missing or duplicate transaction hashes.")
+
         if config.methods_to_filter:
             print(f"Filtering transactions by methods: {config.methods_to_filter}")
-            df['Method'] = df['Method'].astype(str)
-            filtered_df = df[df['Method'].isin(config.methods_to_filter)].copy()
+            # methods outside the categories get code -1, so the mask is a single integer comparison;
+            # only the hash column is projected through it instead of copying the filtered frame
+            method_codes = df['Method'].astype(pd.CategoricalDtype(categories=list(config.methods_to_filter))).cat.codes
+            transaction_hashes = df.loc[method_codes.to_numpy() >= 0, 'Transaction Hash']
         else:
             print("No methods specified for filtering. Processing all transactions in the CSV.")
-            filtered_df = df.copy()
-
-        transactions_to_process_df = filtered_df.copy()
-        transactions_to_process_df['Transaction Hash'] = transactions_to_process_df['Transaction Hash'].astype(str)
-        transactions_to_process_df: pd.DataFrame = transactions_to_process_df.dropna(subset=['Transaction Hash'])
+            transaction_hashes = df['Transaction Hash']
 
-        initial_row_count = len(transactions_to_process_df)
-        transactions_to_process_df.drop_duplicates(subset=['Transaction Hash'], inplace=True)
-        deduplicated_row_count = len(transactions_to_process_df)
-
-        if initial_row_count > deduplicated_row_count:
-            print(f"Removed {initial_row_count - deduplicated_row_count} duplicate transaction hashes.")
-
-        print(f"Loaded {initial_row_count} transactions from {config.transactions_csv_path}.")
-        print(f"Filtered down to {len(filtered_df)} transactions before deduplication.")
-        print(f"Processing {deduplicated_row_count} unique transactions after filtering and deduplication.")
+        print(f"Processing {len(transaction_hashes)} unique transactions after deduplication and filtering.")
 
+        # explorer exports carry the block number of every transaction, which allows fetching whole blocks
+        if 'Blockno' in csv_columns:
+            csv_block_numbers = set(df.loc[transaction_hashes.index, 'Blockno'].dropna().astype('int64').tolist())
 
     except FileNotFoundError:
         print(f"Error: CSV file not found at '{config.transactions_csv_path}'.")
@@ -275,78 +374,160 @@ def run_analytics(verbose: bool = False):
         print(f"Error reading, filtering, or deduplicating CSV file '{config.transactions_csv_path}': {e}")
         return
 
-    contract_abi: list = []
     try:
-        with open(config.abi_json_path, 'r') as f:
-            contract_abi = json.load(f)
+        abi_mtime = os.stat(config.abi_json_path).st_mtime
+        load_contract_abi(config.abi_json_path, abi_mtime)
         print(f"Loaded contract ABI from {config.abi_json_path}.")
     except FileNotFoundError:
         print(f"Error: ABI JSON file not found at '{config.abi_json_path}'.")
         return
     except json.JSONDecodeError:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
         print(f"Error: Could not decode JSON from '{config.abi_json_path}'. Ensure it's valid JSON.")
         return
     except Exception as e:
         print(f"Error reading ABI JSON file '{config.abi_json_path}': {e}")
         return
 
-    raw_results: List[Dict[str, Any]] = []
-    print(f"Processing {len(transactions_to_process_df)} unique transactions concurrently with {config.max_workers} workers...")
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-        future_to_hash = {
-            executor.submit(
-                process_transaction_task,
-                w3,
-                str(row['Transaction Hash']),
-                contract_abi,
-                config.contract_address,
-                config.null_address,
-                config.analysis_mode,
-                config.privado_genesis_method,
-                config.worldid_register_method,
-                verbose
-            ): str(row['Transaction Hash'])
-            for _, row in transactions_to_process_df.iterrows()
-        }
-
-        completed_count = 0
-        total_to_process = len(transactions_to_process_df)
-        for future in concurrent.futures.as_completed(future_to_hash):
-            completed_count += 1
-            hex_hash_string = future_to_hash[future]
-
-            if not verbose:
-                 print(f"Completed {completed_count}/{total_to_process}: {hex_hash_string}", end='\r')
-
-
-            try:
-                result = future.result()
-                raw_results.append(result)
-            except Exception as e:
-                print(f"\nAn error occurred during task execution for hash {hex_hash_string}: {e}")
-                failed_entry: Dict[str, Any] = {
-                    "transaction_hash": hex_hash_string,
-                    "timestamp": None,
-                    "decoded_function": None,
-                    "decoded_parameters": None,
-                    "is_genesis_transition": False,
-                    "privado_decoding_successful": False,
-                    "is_worldid_registration": False,
-                    "is_minting_event": False,
-                    "recipient_address": None,
-                    "token_id": None,
-                    "civic_log_processing_successful": False,
-                    "error": f"Task execution failed: {e}"
-                }
-                raw_results.append(failed_entry)
-
-
-    if not verbose:
-        print("\n")
+    try:
+        # memoized next to the parsed ABI, so repeated runs in one process reuse the selectors
+        selector_table = load_selector_table(config.abi_json_path, abi_mtime)
+    except Exception as e:
+        print(f"Error building function selectors from ABI '{config.abi_json_path}'. Check the ABI: {e}")
+        return
 
-    print("\nAnalytics run complete.")
-    print(f"Total unique transactions processed: {len(raw_results)}")
+    rpc_cache: Optional[RpcCache] = None
+    if config.rpc_cache_dir:
+        try:
+            # entries are keyed by chain, so endpoints of one network share them and no URL is stored
+            rpc_cache = RpcCache(config.rpc_cache_dir, w3.eth.chain_id, read_enabled=not config.force_refresh)
+            print(f"Using RPC cache at {rpc_cache.path}{' (refreshing)' if config.force_refresh else ''}.")
+        except Exception as e:
+            print(f"Warning: Could not open RPC cache in '{config.rpc_cache_dir}': {e}. Continuing without it.")
+
+    # convert every hash to bytes once, both the RPC fetch and the tasks reuse them;
+    # malformed values (e.g. an explorer footer row) get no bytes and are reported as error rows
+    hash_tuples: List[Tuple[str, Optional[HexBytes]]] = [
+        (h, HexBytes(h) if TRANSACTION_HASH_PATTERN.fullmatch(h) else None)
+        for h in transaction_hashes.tolist()
+    ]
+    hash_bytes_list = [h_bytes for _, h_bytes in hash_tuples if h_bytes is not None]
+    if len(hash_bytes_list) < len(hash_tuples):
+        print(f"Warning: {len(hash_tuples) - len(hash_bytes_list)} malformed transaction hashes will be reported as errors.")
+    transactions: Dict[HexBytes, Optional[TxData]] = {}
+    # RPC failures (after retries), kept apart from transactions or receipts the node does not have
+    fetch_errors: Dict[HexBytes, str] = {}
+    block_timestamps: Dict[int, Optional[int]] = {}
+
+    # when the transactions are packed into few blocks, one full block replaces many per-hash lookups
+    if csv_block_numbers and len(csv_block_numbers) <= len(hash_tuples) // 2:
+        print(f"Fetching {len(csv_block_numbers)} blocks with full transactions for {len(hash_tuples)} transactions...")
+        block_transactions, block_timestamps = batch_get_blocks_with_transactions(
+            config.rpc_url,
+            csv_block_numbers,
+            hash_bytes_list,
+            max_concurrency=config.max_concurrency,
+            cache=rpc_cache,
+            verbose=verbose
+        )
+        transactions.update(block_transactions)
+
+    missing_hashes = [h_bytes for h_bytes in hash_bytes_list if h_bytes not in transactions]
+    if missing_hashes:
+        print(f"Fetching {len(missing_hashes)} transactions in batches of {config.rpc_batch_size}...")
+        fetched_transactions = batch_get_transactions(
+            config.rpc_url,
+            missing_hashes,
+            batch_size=config.rpc_batch_size,
+            max_concurrency=config.max_concurrency,
+            cache=rpc_cache,
+            verbose=verbose
+        )
+        for h_bytes, tx in fetched_transactions.items():
+            if isinstance(tx, RpcCallError):
+                fetch_errors[h_bytes] = f"Transaction fetch failed: {tx}"
+            else:
+                transactions[h_bytes] = tx
+
+    receipts: Dict[HexBytes, Optional[TxReceipt]] = {}
+    if config.analysis_mode == 'civic':
+        # group the hashes by block, so blocks holding several of them are read in one call
+        tx_hashes_by_block: Dict[int, List[HexBytes]] = {}
+        for h_bytes, tx in transactions.items():
+            if tx is not None and tx.get('blockNumber') is not None:
+                tx_hashes_by_block.setdefault(tx['blockNumber'], []).append(h_bytes)
+        print(f"Fetching receipts for {sum(map(len, tx_hashes_by_block.values()))} transactions in {len(tx_hashes_by_block)} blocks...")
+        fetched_receipts = batch_get_receipts(
+            config.rpc_url,
+            tx_hashes_by_block,
+            batch_size=config.rpc_batch_size,
+            max_concurrency=config.max_concurrency,
+            cache=rpc_cache,
+            verbose=verbose
+        )
+        for h_bytes, receipt in fetched_receipts.items():
+            if isinstance(receipt, RpcCallError):
+                fetch_errors[h_bytes] = f"Transaction receipt fetch failed: {receipt}"
+            else:
+                receipts[h_bytes] = receipt
+
+    if fetch_errors:
+        print(f"Warning: {len(fetch_errors)} transactions could not be fetched after retries, they are reported as errors.")
+
+    decoded_inputs: Dict[HexBytes, Optional[Tuple[str, Optional[Dict[str, Any]]]]] = {}
+    if config.analysis_mode in ('privado', 'worldid'):
+        decode_items = [
+            (h_bytes, (tx.get('input'), config.contract_address or tx.get('to')))
+            for h_bytes, tx in transactions.items()
+            if tx is not None and (config.contract_address or tx.get('to'))
+        ]
+        # only the genesis / registration calls need their parameters, any other call is
+        # resolved to its function name by selector lookup and never reaches eth_abi
+        # (the Privado identity bubble chart reads the 'transitState' parameters as well)
+        mode_target_methods = (
+            [config.privado_genesis_method, 'transitState'] if config.analysis_mode == 'privado'
+            else [config.worldid_register_method]
+        )
+        mode_target_selectors = target_selectors(selector_table, mode_target_methods)
+        target_decode_items = []
+        for h_bytes, (input_data, contract_address) in decode_items:
+            # inputs arrive as HexBytes from the RPC layer, so slicing needs no hex parsing
+            selector = bytes(input_data[:4]) if input_data else b''
+            if selector in mode_target_selectors:
+                target_decode_items.append((h_bytes, (input_data, contract_address)))
+            elif selector in selector_table:
+                # the function name is known, but the input was never decoded or validated
+                decoded_inputs[h_bytes] = (selector_table[selector][0], None)
+            else:
+                decoded_inputs[h_bytes] = None
+        decode_items = target_decode_items
+
+        print(f"Decoding {len(decode_items)} target transaction inputs...")
+        decoded = decode_many(selector_table, [item for _, item in decode_items], verbose=verbose)
+        decoded_inputs.update(zip([h_bytes for h_bytes, _ in decode_items], decoded))
+
+    # inputs are decoded before any block is fetched: in the decoding modes a transaction whose
+    # input did not decode is reported as a decoding failure, which needs no timestamp
+    skip_undecoded = config.analysis_mode in ('privado', 'worldid') and not config.always_fetch_timestamp
+    block_numbers = {
+        tx['blockNumber'] for h_bytes, tx in transactions.items()
+        if tx is not None and tx.get('blockNumber') is not None and block_timestamps.get(tx['blockNumber']) is None
+        and not (skip_undecoded and decoded_inputs.get(h_bytes) is None)
+    }
+    if block_numbers:
+        print(f"Fetching timestamps for {len(block_numbers)} unique blocks...")
+        block_timestamps.update(batch_get_block_timestamps(
+            config.rpc_url,
+            block_numbers,
+            batch_size=config.rpc_batch_size,
+            max_concurrency=config.max_concurrency,
+            cache=rpc_cache,
+            verbose=verbose
+        ))
+
+    close_sessions()
+    if rpc_cache is not None:
+        rpc_cache.close()
 
     base_results_dir = "results"
     mode_results_dir = os.path.join(base_results_dir, config.analysis_mode)
@@ -357,42 +538,94 @@ def run_analytics(verbose: bool = False):
         os.makedirs(timestamped_results_dir)
         print(f"Created results directory: {timestamped_results_dir}")
 
+    try:
+        if config.results_format == 'parquet':
+            results_writer = ResultsParquetWriter(timestamped_results_dir, current_timestamp, RESULT_FIELD_DTYPES)
+        else:
+            results_writer = ResultsCsvWriter(timestamped_results_dir, current_timestamp, RESULT_FIELD_DTYPES)
+    except Exception as e:
+        print(f"Error creating results {config.results_format.upper()} file in '{timestamped_results_dir}': {e}")
+        return
 
-    if config.analysis_mode == 'privado':
-        privado_decoded_results = [r for r in raw_results if r.get("privado_decoding_successful")]
-        successful_count = len(privado_decoded_results)
-        failed_count = len(raw_results) - successful_count
+    result_columns = allocate_result_columns([h_str for h_str, _ in hash_tuples])
+    print(f"Processing {len(hash_tuples)} unique transactions...")
 
-        plot_privado_decoding_success(successful_count, failed_count, timestamped_results_dir, current_timestamp)
-        plot_privado_genesis_cumulative(privado_decoded_results, timestamped_results_dir, current_timestamp)
-        plot_privado_genesis_daily(privado_decoded_results, timestamped_results_dir, current_timestamp)
-        plot_privado_identity_frequency_bubble_chart(privado_decoded_results, timestamped_results_dir, current_timestamp)
+    # resolve every transaction's block timestamp up front, tasks only receive the value
+    tx_block_timestamps: Dict[HexBytes, Optional[int]] = {
+        h_bytes: block_timestamps.get(tx.get('blockNumber'))
+        for h_bytes, tx in transactions.items()
+        if tx is not None
+    }
 
-    elif config.analysis_mode == 'worldid':
-        worldid_decoded_results = [r for r in raw_results if r.get("worldid_decoding_successful")]
-        successful_count = len(worldid_decoded_results)
-        failed_count = len(raw_results) - successful_count
+    null_address_topic = address_topic(config.null_address)
+
+    # every RPC call has already been made by the async prefetch above, so the tasks are
+    # pure transformations and run inline instead of in a thread pool
+    with results_writer:
+        successful_count = 0
+        skipped_count = 0
+        success_field = SUCCESS_FIELD_BY_MODE[config.analysis_mode]
+        total_to_process = len(hash_tuples)
+        # refresh the progress line about every 1% instead of on every completed task
+        progress_interval = max(1, total_to_process // 100)
+        for index, (hex_hash_string, h_bytes) in enumerate(hash_tuples):
+            completed_count = index + 1
+
+            if h_bytes is None:
+                # the preallocated row already holds the empty defaults, only the error is set
+                result_columns["error"][index] = "Invalid transaction hash"
+            elif h_bytes in fetch_errors:
+                result_columns["error"][index] = fetch_errors[h_bytes]
+            else:
+                try:
+                    result = process_transaction_task(
+                        hex_hash_string,
+                        transactions.get(h_bytes),
+                        tx_block_timestamps.get(h_bytes),
+                        decoded_inputs.get(h_bytes),
+                        receipts.get(h_bytes),
+                        config.contract_address,
+                        null_address_topic,
+                        config.analysis_mode,
+                        config.privado_genesis_method,
+                        config.worldid_register_method,
+                        verbose
+                    )
+                    store_result(result_columns, index, result)
+                    if result[success_field]:
+                        successful_count += 1
+                    elif result["error"] == DECODE_SKIPPED_ERROR:
+                        skipped_count += 1
+                except Exception as e:
+                    print(f"\nAn error occurred during task execution for hash {hex_hash_string}: {e}")
+                    result_columns["error"][index] = f"Task execution failed: {e}"
+
+            results_writer.write(result_row(result_columns, index))
+
+            if not verbose and (completed_count % progress_interval == 0 or completed_count == total_to_process):
+                 print(f"Completed {completed_count}/{total_to_process}", end='\r')
 
-        plot_worldid_decoding_success(successful_count, failed_count, timestamped_results_dir, current_timestamp)
-        plot_worldid_registrations_cumulative(worldid_decoded_results, timestamped_results_dir, current_timestamp)
-        plot_worldid_registrations_daily(worldid_decoded_results, timestamped_results_dir, current_timestamp)
 
-    elif config.analysis_mode == 'civic':
-        civic_minting_results = [r for r in raw_results if r.get("is_minting_event")]
-        successful_count = len(civic_minting_results)
-        failed_count = len(raw_results) - successful_count
+    if not verbose:
+        print("\n")
+
+    print("\nAnalytics run complete.")
+    results_df = build_results_df(result_columns)
+    failed_count = len(results_df) - successful_count - skipped_count
+    print(f"Total unique transactions processed: {len(results_df)}")
+    if skipped_count:
+        print(f"Calls to non-target methods, not decoded: {skipped_count}")
 
-        plot_civic_minting_success(successful_count, failed_count, timestamped_results_dir, current_timestamp)
-        plot_civic_cumulative_minted_tokens_over_time(civic_minting_results, timestamped_results_dir, current_timestamp)
-        plot_civic_daily_minted_tokens(civic_minting_results, timestamped_results_dir, current_timestamp)
-        plot_civic_recipient_address_frequency_bubble_chart(civic_minting_results, timestamped_results_dir, current_timestamp)
 
-    save_results_csv(raw_results, timestamped_results_dir, current_timestamp)
+    generate_mode_graphics(
+        config.analysis_mode, results_df, successful_count, failed_count, skipped_count,
+        timestamped_results_dir, current_timestamp
+    )
 
 
     if verbose:
         print("\n--- Example Raw Results (First 5) ---")
-        for _, result in enumerate(raw_results[:5]):
+        for result in results_df.head(5).to_dict('records'):
             print(f"Tx Hash: {result.get('transaction_hash')}")
             print(f"  Timestamp: {result.get('timestamp')}")
             if result.get('error'):
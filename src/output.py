@@ -1,134 +1,198 @@
+import matplotlib
+# charts are only written to files, the non-interactive backend skips GUI toolkit probing
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+# draw long line paths in chunks, which keeps Agg rendering of large cumulative series fast
+plt.rcParams['agg.path.chunksize'] = 10000
+import abc
 import pandas as pd
 import os
-from typing import List, Dict, Any
-from collections import Counter
+import concurrent.futures
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import matplotlib.dates as mdates
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from src.tx_details import checksum_decoded_addresses
+
+# every chart is drawn on this one figure and axes, cleared between charts instead of allocating new ones
+_figure: Optional[plt.Figure] = None
+_axes: Optional[plt.Axes] = None
+
+# charts are rendered at a lower resolution than matplotlib's default 100 DPI, which cuts
+# rasterization and PNG encoding time with the pixel count
+CHART_DPI = 80
+# fixed margins in inches replace a tight_layout pass (which draws the whole figure once just
+# to measure it); charts with 45 degree date or address tick labels need a deep bottom margin
+_ROTATED_LABEL_MARGINS_INCHES = {'left': 1.0, 'right': 0.3, 'bottom': 1.3, 'top': 0.5}
+# the success bar charts have short horizontal category labels and no x axis label
+_BAR_CHART_MARGINS_INCHES = {'left': 0.9, 'right': 0.3, 'bottom': 0.5, 'top': 0.5}
+
+
+def _reset_figure(
+    figsize: Tuple[float, float], margins: Dict[str, float] = _ROTATED_LABEL_MARGINS_INCHES
+) -> Tuple[plt.Figure, plt.Axes]:
+    """Clears and resizes the shared figure, applies the margins in inches and returns it with its axes."""
+    global _figure, _axes
+    if _figure is None or _axes is None:
+        _figure, _axes = plt.subplots(figsize=figsize)
+    else:
+        _axes.clear()
+        _figure.set_size_inches(figsize)
+    width, height = figsize
+    _figure.subplots_adjust(
+        left=margins['left'] / width,
+        right=1 - margins['right'] / width,
+        bottom=margins['bottom'] / height,
+        top=1 - margins['top'] / height
+    )
+    return _figure, _axes
+
+
+def _fast_savefig(figure: plt.Figure, path: str):
+    """
+    Saves a figure as a PNG at CHART_DPI with the fastest zlib level and no metadata.
+    Charts are flat colours, so level 1 costs little file size while the default
+    level dominates the save time.
+    """
+    figure.savefig(path, dpi=CHART_DPI, pil_kwargs={'compress_level': 1, 'optimize': False}, metadata={'Software': None})
+
+
+def _sorted_timestamps(results_df: pd.DataFrame, mask: pd.Series) -> np.ndarray:
+    """Returns the timestamps of the masked rows as int64 in ascending order; the mask must exclude missing timestamps."""
+    timestamps = results_df.loc[mask, 'timestamp'].to_numpy(dtype=np.int64)
+    # results follow the input CSV, which block explorers export in block order, so the sort is usually skipped
+    if timestamps.size > 1 and (np.diff(timestamps) < 0).any():
+        timestamps = np.sort(timestamps, kind='stable')
+    return timestamps
+
+
+def _daily_counts(timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Counts unix timestamps per UTC day.
+
+    Args:
+        timestamps: Unix timestamps in seconds, non-empty and sorted, see _sorted_timestamps.
+
+    Returns:
+        The matplotlib date number of every day with at least one timestamp, in order, and its count.
+    """
+    # integer day indices avoid allocating a datetime.date object per row, and since the
+    # timestamps are sorted, each day is one run whose length is its count
+    days = timestamps // 86400
+    run_starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    counts = np.diff(np.r_[run_starts, days.size])
+    return mdates.date2num(days[run_starts].astype('datetime64[D]')), counts
+
 
 # --- Functions for Privado ID Analysis ---
 
-def plot_privado_decoding_success(successful_count: int, failed_count: int, results_dir: str, timestamp: int):
-    """Generates and saves a bar chart for Privado ID input decoding success."""
+def plot_privado_decoding_success(
+    successful_count: int, failed_count: int, skipped_count: int, results_dir: str, timestamp: int
+):
+    """
+    Generates and saves a bar chart for Privado ID input decoding success.
+    Calls to non-target methods, whose parameters are not decoded, get their own bar,
+    so the bars add up to every processed transaction.
+    """
     print("\nGenerating Privado ID Decoding Success graphic...")
 
-    labels = ['Successful Decodes', 'Failed Decodes']
-    counts = [successful_count, failed_count]
-    colors = ['#4CAF50', '#F44336']
+    labels = ['Successful Decodes', 'Failed Decodes', 'Not Decoded (Non-Target)']
+    counts = [successful_count, failed_count, skipped_count]
+    colors = ['#4CAF50', '#F44336', '#9E9E9E']
 
-    plt.figure(figsize=(8, 6))
-    plt.bar(labels, counts, color=colors)
-    plt.ylabel('Number of Transactions')
-    plt.title('Privado ID Input Data Decoding Results')
-    plt.ylim(0, max(counts) * 1.1)
+    fig, ax = _reset_figure((8, 6), _BAR_CHART_MARGINS_INCHES)
+    ax.bar(labels, counts, color=colors)
+    ax.set_ylabel('Number of Transactions')
+    ax.set_title('Privado ID Input Data Decoding Results')
+    ax.set_ylim(0, max(counts) * 1.1)
 
     for i, count in enumerate(counts):
-        plt.text(i, count + (max(counts) * 0.02), str(count), ha='center')
+        ax.text(i, count + (max(counts) * 0.02), str(count), ha='center')
 
-    plt.tight_layout()
     decoding_chart_filename = f"{timestamp}_privado_decoding_results_bar_chart.png"
     decoding_chart_path = os.path.join(results_dir, decoding_chart_filename)
     try:
-        plt.savefig(decoding_chart_path)
+        _fast_savefig(fig, decoding_chart_path)
         print(f"Privado ID decoding success bar chart saved to {decoding_chart_path}")
     except Exception as e:
         print(f"Error saving Privado ID decoding success chart: {e}")
-    plt.close()
 
 
-def plot_privado_genesis_cumulative(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_privado_genesis_cumulative(genesis_timestamps: np.ndarray, results_dir: str, timestamp: int):
     """Generates and saves a line chart for cumulative Privado ID genesis transitions over time."""
     print("\nGenerating Cumulative Privado ID Genesis Transitions Over Time graphic...")
 
-    genesis_transitions = [
-        r for r in results
-        if r.get("privado_decoding_successful") and r.get("is_genesis_transition") and r.get("timestamp") is not None
-    ]
-
-    if not genesis_transitions:
+    if genesis_timestamps.size == 0:
         print("No Privado ID genesis transition transactions with timestamps found to plot over time.")
         return
 
-    genesis_df = pd.DataFrame(genesis_transitions)
-
-    genesis_df['datetime'] = pd.to_datetime(genesis_df['timestamp'], unit='s')
+    genesis_datetimes = pd.to_datetime(genesis_timestamps, unit='s')
+    cumulative_counts = np.arange(1, len(genesis_timestamps) + 1, dtype=np.int64)
 
-    genesis_df = genesis_df.sort_values(by='datetime')
+    fig, ax = _reset_figure((12, 6))
+    ax.plot(genesis_datetimes, cumulative_counts, marker='o', linestyle='-')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Cumulative Count of Genesis Transitions')
+    ax.set_title('Cumulative Privado ID Genesis Identity Transitions Over Time')
+    ax.grid(True)
 
-    genesis_df['cumulative_count'] = range(1, len(genesis_df) + 1)
+    fig.autofmt_xdate()
 
-    plt.figure(figsize=(12, 6))
-    plt.plot(genesis_df['datetime'], genesis_df['cumulative_count'], marker='o', linestyle='-')
-    plt.xlabel('Time')
-    plt.ylabel('Cumulative Count of Genesis Transitions')
-    plt.title('Cumulative Privado ID Genesis Identity Transitions Over Time')
-    plt.grid(True)
-
-    plt.gcf().autofmt_xdate()
-
-    plt.tight_layout()
     cumulative_chart_filename = f"{timestamp}_privado_cumulative_genesis_transitions_over_time.png"
     cumulative_chart_path = os.path.join(results_dir, cumulative_chart_filename)
     try:
-        plt.savefig(cumulative_chart_path)
+        _fast_savefig(fig, cumulative_chart_path)
         print(f"Cumulative Privado ID genesis transitions chart saved to {cumulative_chart_path}")
     except Exception as e:
         print(f"Error saving cumulative Privado ID genesis transitions chart: {e}")
-    plt.close()
 
 
-def plot_privado_genesis_daily(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_privado_genesis_daily(genesis_timestamps: np.ndarray, results_dir: str, timestamp: int):
     """
     Generates and saves a bar chart showing the number of Privado ID genesis transitions per day.
     """
     print("\nGenerating Daily Privado ID Genesis Transitions graphic...")
 
-    genesis_transitions = [
-        r for r in results
-        if r.get("privado_decoding_successful") and r.get("is_genesis_transition") and r.get("timestamp") is not None
-    ]
-
-    if not genesis_transitions:
+    if genesis_timestamps.size == 0:
         print("No Privado ID genesis transition transactions with timestamps found to plot daily counts.")
         return
 
-    genesis_df = pd.DataFrame(genesis_transitions)
-
-    genesis_df['date'] = pd.to_datetime(genesis_df['timestamp'], unit='s').dt.date
-
-    daily_counts = genesis_df['date'].value_counts().sort_index()
+    day_numbers, daily_counts = _daily_counts(genesis_timestamps)
 
-    if daily_counts.empty:
-        print("No daily Privado ID genesis transition counts to plot.")
-        return
-
-    plt.figure(figsize=(15, 7))
-    ax = plt.gca()
+    fig, ax = _reset_figure((15, 7))
 
-    ax.bar(mdates.date2num(daily_counts.index), daily_counts.values, color='skyblue')
+    ax.bar(day_numbers, daily_counts, color='skyblue')
 
-    plt.xlabel('Date')
-    plt.ylabel('Number of Genesis Transitions')
-    plt.title('Daily Privado ID Genesis Identity Transitions Over Time')
-    plt.grid(axis='y', linestyle='--', alpha=0.6)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Number of Genesis Transitions')
+    ax.set_title('Daily Privado ID Genesis Identity Transitions Over Time')
+    ax.grid(axis='y', linestyle='--', alpha=0.6)
 
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45, ha='right')
-
-    plt.tight_layout()
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
     daily_chart_filename = f"{timestamp}_privado_daily_genesis_transitions.png"
     daily_chart_path = os.path.join(results_dir, daily_chart_filename)
     try:
-        plt.savefig(daily_chart_path)
+        _fast_savefig(fig, daily_chart_path)
         print(f"Daily Privado ID genesis transitions chart saved to {daily_chart_path}")
     except Exception as e:
         print(f"Error saving daily Privado ID genesis transitions chart: {e}")
-    plt.close()
 
 
-def plot_privado_identity_frequency_bubble_chart(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_privado_genesis_over_time(results_df: pd.DataFrame, results_dir: str, timestamp: int):
+    """Generates both Privado ID genesis transition charts from one pass over the successfully decoded rows."""
+    genesis_mask = results_df['privado_decoding_successful'] & results_df['is_genesis_transition'] & results_df['timestamp'].notna()
+    genesis_timestamps = _sorted_timestamps(results_df, genesis_mask)
+    plot_privado_genesis_cumulative(genesis_timestamps, results_dir, timestamp)
+    plot_privado_genesis_daily(genesis_timestamps, results_dir, timestamp)
+
+
+def plot_privado_identity_frequency_bubble_chart(results_df: pd.DataFrame, results_dir: str, timestamp: int):
     """
     Generates and saves a bubble chart showing the frequency of identity IDs
     in 'transitState' transactions for Privado ID.
@@ -136,35 +200,31 @@ def plot_privado_identity_frequency_bubble_chart(results: List[Dict[str, Any]],
     print("\nGenerating Privado ID Identity Frequency graphic...")
 
     # filter for successfully decoded 'transitState' transactions with 'id' parameter
-    transit_state_ids = []
-    for r in results:
-        if (r.get("privado_decoding_successful") and
-            r.get("decoded_function") == "transitState" and
-            r.get("decoded_parameters") and
-            'id' in r["decoded_parameters"]):
-            # convert the ID to string to handle potentially very large integers
-            transit_state_ids.append(str(r["decoded_parameters"]["id"]))
-
-    if not transit_state_ids:
+    transit_state_mask = results_df['privado_decoding_successful'] & results_df['decoded_function'].eq("transitState")
+    transit_state_ids = pd.Series([
+        # IDs are kept as Python ints (object dtype holds values beyond 64 bits), only tick labels are stringified
+        parameters["id"]
+        for parameters in results_df.loc[transit_state_mask, 'decoded_parameters']
+        if parameters and 'id' in parameters
+    ], dtype=object)
+
+    if transit_state_ids.empty:
         print("No 'transitState' transactions with identity IDs found to plot for Privado ID.")
         return
 
-    id_counts = Counter(transit_state_ids)
-
-    unique_ids = list(id_counts.keys())
-    counts = list(id_counts.values())
+    # value_counts counts and sorts by frequency (descending) in one vectorized pass
+    id_counts = transit_state_ids.value_counts()
+    # only the tick labels are read from the index, so it is not copied into a list
+    sorted_unique_ids = id_counts.index
+    sorted_counts = id_counts.to_numpy()
 
-    sorted_indices = sorted(range(len(counts)), key=lambda k: counts[k], reverse=True)
-    sorted_unique_ids = [unique_ids[i] for i in sorted_indices]
-    sorted_counts = [counts[i] for i in sorted_indices]
-
-    x_indices = range(len(sorted_unique_ids))
+    x_indices = np.arange(len(sorted_unique_ids))
 
     size_multiplier = 50
-    bubble_sizes = [np.log1p(count) * size_multiplier for count in sorted_counts]
+    bubble_sizes = np.log1p(sorted_counts) * size_multiplier
 
-    plt.figure(figsize=(15, 7))
-    scatter = plt.scatter(
+    fig, ax = _reset_figure((15, 7))
+    scatter = ax.scatter(
         x_indices,
         sorted_counts,
         s=bubble_sizes,
@@ -173,24 +233,24 @@ def plot_privado_identity_frequency_bubble_chart(results: List[Dict[str, Any]],
         linewidth=1
     )
 
-    plt.xlabel('Unique Identity ID (Sorted by Frequency)')
-    plt.ylabel('Number of Transactions')
-    plt.title('Frequency of Identity IDs in Transit State Transactions (Privado ID)')
-    plt.grid(True, linestyle='--', alpha=0.6)
+    ax.set_xlabel('Unique Identity ID (Sorted by Frequency)')
+    ax.set_ylabel('Number of Transactions')
+    ax.set_title('Frequency of Identity IDs in Transit State Transactions (Privado ID)')
+    ax.grid(True, linestyle='--', alpha=0.6)
 
     num_ticks = min(20, len(sorted_unique_ids))
-    tick_indices = [int(i * len(x_indices) / num_ticks) for i in range(num_ticks)]
-    plt.xticks([x_indices[i] for i in tick_indices], [sorted_unique_ids[i][:10] + '...' for i in tick_indices], rotation=45, ha='right')
+    tick_indices = np.arange(num_ticks) * len(x_indices) // num_ticks
+    # truncate only the labelled keys, in one vectorized string operation
+    tick_labels = sorted_unique_ids[tick_indices].astype(str).str[:10] + '...'
+    ax.set_xticks(x_indices[tick_indices], tick_labels, rotation=45, ha='right')
 
-    plt.tight_layout()
     identity_freq_chart_filename = f"{timestamp}_privado_identity_frequency_bubble_chart.png"
     identity_freq_chart_path = os.path.join(results_dir, identity_freq_chart_filename)
     try:
-        plt.savefig(identity_freq_chart_path)
+        _fast_savefig(fig, identity_freq_chart_path)
         print(f"Privado ID identity frequency bubble chart saved to {identity_freq_chart_path}")
     except Exception as e:
         print(f"Error saving Privado ID identity frequency chart: {e}")
-    plt.close()
 
 
 # --- Functions for Civic Analysis ---
@@ -203,150 +263,123 @@ def plot_civic_minting_success(successful_count: int, failed_count: int, results
     counts = [successful_count, failed_count]
     colors = ['#4CAF50', '#F44336']
 
-    plt.figure(figsize=(8, 6))
-    plt.bar(labels, counts, color=colors)
-    plt.ylabel('Number of Transactions Processed')
-    plt.title('Civic Minting Event Identification Results')
-    plt.ylim(0, max(counts) * 1.1)
+    fig, ax = _reset_figure((8, 6), _BAR_CHART_MARGINS_INCHES)
+    ax.bar(labels, counts, color=colors)
+    ax.set_ylabel('Number of Transactions Processed')
+    ax.set_title('Civic Minting Event Identification Results')
+    ax.set_ylim(0, max(counts) * 1.1)
 
     for i, count in enumerate(counts):
-        plt.text(i, count + (max(counts) * 0.02), str(count), ha='center')
+        ax.text(i, count + (max(counts) * 0.02), str(count), ha='center')
 
-    plt.tight_layout()
     minting_chart_filename = f"{timestamp}_civic_minting_identification_bar_chart.png"
     minting_chart_path = os.path.join(results_dir, minting_chart_filename)
     try:
-        plt.savefig(minting_chart_path)
+        _fast_savefig(fig, minting_chart_path)
         print(f"Civic minting identification bar chart saved to {minting_chart_path}")
     except Exception as e:
         print(f"Error saving Civic minting identification chart: {e}")
-    plt.close()
 
 
-def plot_civic_cumulative_minted_tokens_over_time(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_civic_cumulative_minted_tokens_over_time(minting_timestamps: np.ndarray, results_dir: str, timestamp: int):
     """Generates and saves a line chart for cumulative Civic minted tokens over time."""
     print("\nGenerating Cumulative Civic Minted Tokens Over Time graphic...")
 
-    minting_events = [
-        r for r in results
-        if r.get("is_minting_event") and r.get("timestamp") is not None
-    ]
-
-    if not minting_events:
+    if minting_timestamps.size == 0:
         print("No Civic minting events with timestamps found to plot over time.")
         return
 
-    minting_df = pd.DataFrame(minting_events)
+    minting_datetimes = pd.to_datetime(minting_timestamps, unit='s')
+    cumulative_counts = np.arange(1, len(minting_timestamps) + 1, dtype=np.int64)
 
-    minting_df['datetime'] = pd.to_datetime(minting_df['timestamp'], unit='s')
+    fig, ax = _reset_figure((12, 6))
+    ax.plot(minting_datetimes, cumulative_counts, marker='o', linestyle='-')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Cumulative Count of Minted Tokens')
+    ax.set_title('Cumulative Civic Minted Tokens Over Time')
+    ax.grid(True)
 
-    minting_df = minting_df.sort_values(by='datetime')
+    fig.autofmt_xdate()
 
-    minting_df['cumulative_count'] = range(1, len(minting_df) + 1)
-
-    plt.figure(figsize=(12, 6))
-    plt.plot(minting_df['datetime'], minting_df['cumulative_count'], marker='o', linestyle='-')
-    plt.xlabel('Time')
-    plt.ylabel('Cumulative Count of Minted Tokens')
-    plt.title('Cumulative Civic Minted Tokens Over Time')
-    plt.grid(True)
-
-    plt.gcf().autofmt_xdate()
-
-    plt.tight_layout()
     cumulative_chart_filename = f"{timestamp}_civic_cumulative_minted_tokens_over_time.png"
     cumulative_chart_path = os.path.join(results_dir, cumulative_chart_filename)
     try:
-        plt.savefig(cumulative_chart_path)
+        _fast_savefig(fig, cumulative_chart_path)
         print(f"Cumulative Civic minted tokens chart saved to {cumulative_chart_path}")
     except Exception as e:
         print(f"Error saving cumulative Civic minted tokens chart: {e}")
-    plt.close()
 
 
-def plot_civic_daily_minted_tokens(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_civic_daily_minted_tokens(minting_timestamps: np.ndarray, results_dir: str, timestamp: int):
     """
     Generates and saves a bar chart showing the number of Civic minted tokens per day.
     """
     print("\nGenerating Daily Civic Minted Tokens graphic...")
 
-    minting_events = [
-        r for r in results
-        if r.get("is_minting_event") and r.get("timestamp") is not None
-    ]
-
-    if not minting_events:
+    if minting_timestamps.size == 0:
         print("No Civic minting events with timestamps found to plot daily counts.")
         return
 
-    minting_df = pd.DataFrame(minting_events)
+    day_numbers, daily_counts = _daily_counts(minting_timestamps)
 
-    minting_df['date'] = pd.to_datetime(minting_df['timestamp'], unit='s').dt.date
+    fig, ax = _reset_figure((15, 7))
 
-    daily_counts = minting_df['date'].value_counts().sort_index()
+    ax.bar(day_numbers, daily_counts, color='skyblue')
 
-    if daily_counts.empty:
-        print("No daily Civic minted token counts to plot.")
-        return
-
-    plt.figure(figsize=(15, 7))
-    ax = plt.gca()
-
-    ax.bar(mdates.date2num(daily_counts.index), daily_counts.values, color='skyblue')
-
-    plt.xlabel('Date')
-    plt.ylabel('Number of Minted Tokens')
-    plt.title('Daily Civic Minted Tokens Over Time')
-    plt.grid(axis='y', linestyle='--', alpha=0.6)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Number of Minted Tokens')
+    ax.set_title('Daily Civic Minted Tokens Over Time')
+    ax.grid(axis='y', linestyle='--', alpha=0.6)
 
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45, ha='right')
-
-    plt.tight_layout()
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
     daily_chart_filename = f"{timestamp}_civic_daily_minted_tokens.png"
     daily_chart_path = os.path.join(results_dir, daily_chart_filename)
     try:
-        plt.savefig(daily_chart_path)
+        _fast_savefig(fig, daily_chart_path)
         print(f"Daily Civic minted tokens chart saved to {daily_chart_path}")
     except Exception as e:
         print(f"Error saving Civic minted tokens chart: {e}")
-    plt.close()
 
 
-def plot_civic_recipient_address_frequency_bubble_chart(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_civic_minted_tokens_over_time(results_df: pd.DataFrame, results_dir: str, timestamp: int):
+    """Generates the cumulative and daily Civic minting charts, sharing the minting event timestamps."""
+    minting_mask = results_df['is_minting_event'] & results_df['timestamp'].notna()
+    minting_timestamps = _sorted_timestamps(results_df, minting_mask)
+    plot_civic_cumulative_minted_tokens_over_time(minting_timestamps, results_dir, timestamp)
+    plot_civic_daily_minted_tokens(minting_timestamps, results_dir, timestamp)
+
+
+def plot_civic_recipient_address_frequency_bubble_chart(results_df: pd.DataFrame, results_dir: str, timestamp: int):
     """
     Generates and saves a bubble chart showing the frequency of recipient addresses
     from Civic minting events.
     """
     print("\nGenerating Civic Recipient Address Frequency graphic...")
 
-    recipient_addresses = [
-        r.get("recipient_address") for r in results
-        if r.get("is_minting_event") and r.get("recipient_address")
+    recipient_addresses = results_df.loc[
+        results_df['is_minting_event'] & results_df['recipient_address'].notna(), 'recipient_address'
     ]
 
-    if not recipient_addresses:
+    if recipient_addresses.empty:
         print("No recipient addresses found from Civic minting events to plot.")
         return
 
-    address_counts = Counter(recipient_addresses)
-
-    unique_addresses = list(address_counts.keys())
-    counts = list(address_counts.values())
-
-    sorted_indices = sorted(range(len(counts)), key=lambda k: counts[k], reverse=True)
-    sorted_unique_addresses = [unique_addresses[i] for i in sorted_indices]
-    sorted_counts = [counts[i] for i in sorted_indices]
+    # value_counts counts and sorts by frequency (descending) in one vectorized pass
+    address_counts = recipient_addresses.value_counts()
+    # only the tick labels are read from the index, so it is not copied into a list
+    sorted_unique_addresses = address_counts.index
+    sorted_counts = address_counts.to_numpy()
 
-    x_indices = range(len(sorted_unique_addresses))
+    x_indices = np.arange(len(sorted_unique_addresses))
 
     size_multiplier = 50
-    bubble_sizes = [np.log1p(count) * size_multiplier for count in sorted_counts]
+    bubble_sizes = np.log1p(sorted_counts) * size_multiplier
 
-    plt.figure(figsize=(15, 7))
-    scatter = plt.scatter(
+    fig, ax = _reset_figure((15, 7))
+    scatter = ax.scatter(
         x_indices,
         sorted_counts,
         s=bubble_sizes,
@@ -355,161 +388,319 @@ def plot_civic_recipient_address_frequency_bubble_chart(results: List[Dict[str,
         linewidth=1
     )
 
-    plt.xlabel('Recipient Address (Sorted by Frequency)')
-    plt.ylabel('Number of Minted Tokens Received')
-    plt.title('Frequency of Recipient Addresses in Minting Events (Civic)')
-    plt.grid(True, linestyle='--', alpha=0.6)
+    ax.set_xlabel('Recipient Address (Sorted by Frequency)')
+    ax.set_ylabel('Number of Minted Tokens Received')
+    ax.set_title('Frequency of Recipient Addresses in Minting Events (Civic)')
+    ax.grid(True, linestyle='--', alpha=0.6)
 
     num_ticks = min(20, len(sorted_unique_addresses))
-    tick_indices = [int(i * len(x_indices) / num_ticks) for i in range(num_ticks)]
-    plt.xticks([x_indices[i] for i in tick_indices], [sorted_unique_addresses[i][:10] + '...' for i in tick_indices], rotation=45, ha='right') # type: ignore[reportOptionalSubscript]
+    tick_indices = np.arange(num_ticks) * len(x_indices) // num_ticks
+    # truncate only the labelled keys, in one vectorized string operation
+    tick_labels = sorted_unique_addresses[tick_indices].str[:10] + '...'
+    ax.set_xticks(x_indices[tick_indices], tick_labels, rotation=45, ha='right')
 
-    plt.tight_layout()
     recipient_freq_chart_filename = f"{timestamp}_civic_recipient_address_frequency_bubble_chart.png"
     recipient_freq_chart_path = os.path.join(results_dir, recipient_freq_chart_filename)
     try:
-        plt.savefig(recipient_freq_chart_path)
+        _fast_savefig(fig, recipient_freq_chart_path)
         print(f"Civic recipient address frequency bubble chart saved to {recipient_freq_chart_path}")
     except Exception as e:
         print(f"Error saving Civic recipient address frequency chart: {e}")
-    plt.close()
 
 # --- Functions for World ID Analysis ---
 
-def plot_worldid_decoding_success(successful_count: int, failed_count: int, results_dir: str, timestamp: int):
-    """Generates and saves a bar chart for World ID input decoding success."""
+def plot_worldid_decoding_success(
+    successful_count: int, failed_count: int, skipped_count: int, results_dir: str, timestamp: int
+):
+    """
+    Generates and saves a bar chart for World ID input decoding success.
+    Calls to non-target methods, whose parameters are not decoded, get their own bar,
+    so the bars add up to every processed transaction.
+    """
     print("\nGenerating World ID Decoding Success graphic...")
 
-    labels = ['Successful Decodes', 'Failed Decodes']
-    counts = [successful_count, failed_count]
-    colors = ['#4CAF50', '#F44336']
+    labels = ['Successful Decodes', 'Failed Decodes', 'Not Decoded (Non-Target)']
+    counts = [successful_count, failed_count, skipped_count]
+    colors = ['#4CAF50', '#F44336', '#9E9E9E']
 
-    plt.figure(figsize=(8, 6))
-    plt.bar(labels, counts, color=colors)
-    plt.ylabel('Number of Transactions')
-    plt.title('World ID Input Data Decoding Results')
-    plt.ylim(0, max(counts) * 1.1)
+    fig, ax = _reset_figure((8, 6), _BAR_CHART_MARGINS_INCHES)
+    ax.bar(labels, counts, color=colors)
+    ax.set_ylabel('Number of Transactions')
+    ax.set_title('World ID Input Data Decoding Results')
+    ax.set_ylim(0, max(counts) * 1.1)
 
     for i, count in enumerate(counts):
-        plt.text(i, count + (max(counts) * 0.02), str(count), ha='center')
+        ax.text(i, count + (max(counts) * 0.02), str(count), ha='center')
 
-    plt.tight_layout()
     decoding_chart_filename = f"{timestamp}_worldid_decoding_results_bar_chart.png"
     decoding_chart_path = os.path.join(results_dir, decoding_chart_filename)
     try:
-        plt.savefig(decoding_chart_path)
+        _fast_savefig(fig, decoding_chart_path)
         print(f"World ID decoding success bar chart saved to {decoding_chart_path}")
     except Exception as e:
         print(f"Error saving World ID decoding success chart: {e}")
-    plt.close()
 
 
-def plot_worldid_registrations_cumulative(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_worldid_registrations_cumulative(registration_timestamps: np.ndarray, results_dir: str, timestamp: int):
     """Generates and saves a line chart for cumulative World ID registrations over time."""
     print("\nGenerating Cumulative World ID Registrations Over Time graphic...")
 
-    # filter for successfully decoded registration transactions with a timestamp
-    registrations = [
-        r for r in results
-        if r.get("worldid_decoding_successful") and r.get("is_worldid_registration") and r.get("timestamp") is not None
-    ]
-
-    if not registrations:
+    if registration_timestamps.size == 0:
         print("No World ID registration transactions with timestamps found to plot over time.")
         return
 
-    registrations_df = pd.DataFrame(registrations)
-
-    registrations_df['datetime'] = pd.to_datetime(registrations_df['timestamp'], unit='s')
-
-    registrations_df = registrations_df.sort_values(by='datetime')
-
-    registrations_df['cumulative_count'] = range(1, len(registrations_df) + 1)
+    registration_datetimes = pd.to_datetime(registration_timestamps, unit='s')
+    cumulative_counts = np.arange(1, len(registration_timestamps) + 1, dtype=np.int64)
 
-    plt.figure(figsize=(12, 6))
-    plt.plot(registrations_df['datetime'], registrations_df['cumulative_count'], marker='o', linestyle='-')
-    plt.xlabel('Time')
-    plt.ylabel('Cumulative Count of Registrations')
-    plt.title('Cumulative World ID Registrations Over Time')
-    plt.grid(True)
+    fig, ax = _reset_figure((12, 6))
+    ax.plot(registration_datetimes, cumulative_counts, marker='o', linestyle='-')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Cumulative Count of Registrations')
+    ax.set_title('Cumulative World ID Registrations Over Time')
+    ax.grid(True)
 
-    plt.gcf().autofmt_xdate()
+    fig.autofmt_xdate()
 
-    plt.tight_layout()
     cumulative_chart_filename = f"{timestamp}_worldid_cumulative_registrations_over_time.png"
     cumulative_chart_path = os.path.join(results_dir, cumulative_chart_filename)
     try:
-        plt.savefig(cumulative_chart_path)
+        _fast_savefig(fig, cumulative_chart_path)
         print(f"Cumulative World ID registrations chart saved to {cumulative_chart_path}")
     except Exception as e:
         print(f"Error saving cumulative World ID registrations chart: {e}")
-    plt.close()
 
 
-def plot_worldid_registrations_daily(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
+def plot_worldid_registrations_daily(registration_timestamps: np.ndarray, results_dir: str, timestamp: int):
     """
     Generates and saves a bar chart showing the number of World ID registrations per day.
     """
     print("\nGenerating Daily World ID Registrations graphic...")
 
-    # filter for successfully decoded registration transactions with a timestamp
-    registrations = [
-        r for r in results
-        if r.get("worldid_decoding_successful") and r.get("is_worldid_registration") and r.get("timestamp") is not None
-    ]
-
-    if not registrations:
+    if registration_timestamps.size == 0:
         print("No World ID registration transactions with timestamps found to plot daily counts.")
         return
 
-    registrations_df = pd.DataFrame(registrations)
-
-    registrations_df['date'] = pd.to_datetime(registrations_df['timestamp'], unit='s').dt.date
-
-    daily_counts = registrations_df['date'].value_counts().sort_index()
-
-    if daily_counts.empty:
-        print("No daily World ID registration counts to plot.")
-        return
+    day_numbers, daily_counts = _daily_counts(registration_timestamps)
 
-    plt.figure(figsize=(15, 7))
-    ax = plt.gca()
+    fig, ax = _reset_figure((15, 7))
 
-    ax.bar(mdates.date2num(daily_counts.index), daily_counts.values, color='skyblue')
+    ax.bar(day_numbers, daily_counts, color='skyblue')
 
-    plt.xlabel('Date')
-    plt.ylabel('Number of Registrations')
-    plt.title('Daily World ID Registrations Over Time')
-    plt.grid(axis='y', linestyle='--', alpha=0.6)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Number of Registrations')
+    ax.set_title('Daily World ID Registrations Over Time')
+    ax.grid(axis='y', linestyle='--', alpha=0.6)
 
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.xticks(rotation=45, ha='right')
-
-    plt.tight_layout()
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
     daily_chart_filename = f"{timestamp}_worldid_daily_registrations.png"
     daily_chart_path = os.path.join(results_dir, daily_chart_filename)
     try:
-        plt.savefig(daily_chart_path)
+        _fast_savefig(fig, daily_chart_path)
         print(f"Daily World ID registrations chart saved to {daily_chart_path}")
     except Exception as e:
         print(f"Error saving daily World ID registrations chart: {e}")
-    plt.close()
+
+
+def plot_worldid_registrations_over_time(results_df: pd.DataFrame, results_dir: str, timestamp: int):
+    """Generates the cumulative and daily World ID registration charts from the same sorted timestamps."""
+    registrations_mask = results_df['worldid_decoding_successful'] & results_df['is_worldid_registration'] & results_df['timestamp'].notna()
+    registration_timestamps = _sorted_timestamps(results_df, registrations_mask)
+    plot_worldid_registrations_cumulative(registration_timestamps, results_dir, timestamp)
+    plot_worldid_registrations_daily(registration_timestamps, results_dir, timestamp)
+
+
+# --- Results Assembly ---
+
+def build_results_df(result_columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Assembles the preallocated result columns into the one DataFrame shared by
+    every graphic, without any per-row type inference.
+
+    Args:
+        result_columns: One array per result field, in output column order, plus the
+            'has_timestamp' mask of the int64 'timestamp' column.
+
+    Returns:
+        The results DataFrame, with a nullable integer 'timestamp' column.
+    """
+    data: Dict[str, Any] = {name: column for name, column in result_columns.items() if name != "has_timestamp"}
+    data["timestamp"] = pd.arrays.IntegerArray(result_columns["timestamp"], ~result_columns["has_timestamp"])
+    return pd.DataFrame(data)
+
+
+# --- Orchestration ---
+
+def generate_mode_graphics(
+    analysis_mode: str,
+    results_df: pd.DataFrame,
+    successful_count: int,
+    failed_count: int,
+    skipped_count: int,
+    results_dir: str,
+    timestamp: int
+):
+    """
+    Generates and saves every graphic of the given analysis mode.
+
+    The mode's success rows are selected once with a vectorized boolean mask,
+    then each graphic (or pair of graphics over the same rows) is rendered in
+    its own process. Every job only receives the columns it reads, so the
+    decoded parameters are pickled just for the chart that needs them.
+
+    Args:
+        analysis_mode: The selected analysis mode ('privado', 'civic', or 'worldid').
+        results_df: The results of every processed transaction, one row per transaction.
+        successful_count: Number of successful results in the mode.
+        failed_count: Number of failed results in the mode.
+        skipped_count: Number of calls to non-target methods, left undecoded.
+        results_dir: Directory the graphics are saved to.
+        timestamp: Run timestamp used as the file name prefix.
+    """
+    plot_jobs: List[Tuple[Callable[..., None], tuple]] = []
+    if analysis_mode == 'privado':
+        privado_decoded_df = results_df.loc[results_df['privado_decoding_successful'].to_numpy()]
+        genesis_columns = ['timestamp', 'privado_decoding_successful', 'is_genesis_transition']
+        identity_columns = ['privado_decoding_successful', 'decoded_function', 'decoded_parameters']
+
+        plot_jobs = [
+            (plot_privado_decoding_success, (successful_count, failed_count, skipped_count)),
+            (plot_privado_genesis_over_time, (privado_decoded_df[genesis_columns],)),
+            (plot_privado_identity_frequency_bubble_chart, (privado_decoded_df[identity_columns],)),
+        ]
+
+    elif analysis_mode == 'worldid':
+        worldid_decoded_df = results_df.loc[results_df['worldid_decoding_successful'].to_numpy()]
+        registration_columns = ['timestamp', 'worldid_decoding_successful', 'is_worldid_registration']
+
+        plot_jobs = [
+            (plot_worldid_decoding_success, (successful_count, failed_count, skipped_count)),
+            (plot_worldid_registrations_over_time, (worldid_decoded_df[registration_columns],)),
+        ]
+
+    elif analysis_mode == 'civic':
+        civic_minting_df = results_df.loc[results_df['is_minting_event'].to_numpy()]
+        minting_columns = ['timestamp', 'is_minting_event']
+        recipient_columns = ['is_minting_event', 'recipient_address']
+
+        plot_jobs = [
+            (plot_civic_minting_success, (successful_count, failed_count)),
+            (plot_civic_minted_tokens_over_time, (civic_minting_df[minting_columns],)),
+            (plot_civic_recipient_address_frequency_bubble_chart, (civic_minting_df[recipient_columns],)),
+        ]
+
+    if not plot_jobs:
+        return
+
+    plot_workers = min(len(plot_jobs), 8, os.cpu_count() or 1)
+    if plot_workers == 1:
+        # a single worker process would only add start-up and pickling cost
+        for plot_function, plot_args in plot_jobs:
+            try:
+                plot_function(*plot_args, results_dir, timestamp)
+            except Exception as e:
+                print(f"\nError generating graphic: {e}")
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=plot_workers) as plot_executor:
+        plot_futures = [
+            plot_executor.submit(plot_function, *plot_args, results_dir, timestamp)
+            for plot_function, plot_args in plot_jobs
+        ]
+        for plot_future in plot_futures:
+            try:
+                plot_future.result()
+            except Exception as e:
+                print(f"\nError generating graphic: {e}")
 
 
 # --- Common Save Function ---
 
-def save_results_csv(results: List[Dict[str, Any]], results_dir: str, timestamp: int):
-    """Saves the raw results to a CSV file."""
-    print("\nSaving raw results to CSV...")
-    results_csv_filename = f"{timestamp}_analytics_results.csv"
-    results_csv_path = os.path.join(results_dir, results_csv_filename)
-    try:
-        results_df = pd.DataFrame(results)
-        results_df.to_csv(results_csv_path, index=False)
-        print(f"Analytics results saved to {results_csv_path}")
-    except Exception as e:
-        print(f"Error saving results to CSV: {e}")
+class _BufferedResultsWriter(abc.ABC):
+    """
+    Buffers analytics results column by column, one row per processed transaction,
+    and hands them to a pyarrow table writer every flush_rows rows, so memory use
+    does not grow with the number of transactions.
+    """
+
+    def __init__(self, path: str, schema: pa.Schema, flush_rows: int):
+        self.path = path
+        self._schema = schema
+        self._text_fields = frozenset(field.name for field in schema if field.type == pa.string())
+        self._flush_rows = flush_rows
+        self._buffer: Dict[str, List[Any]] = {field.name: [] for field in schema}
+        self._writer = self._open_writer()
+
+    @abc.abstractmethod
+    def _open_writer(self) -> Any:
+        """Opens the file at self.path and returns a writer with write_table(table) and close() methods."""
+
+    def write(self, result: Dict[str, Any]):
+        """Buffers one result row, checksumming any decoded address parameters."""
+        if result.get('decoded_parameters'):
+            result = {**result, 'decoded_parameters': checksum_decoded_addresses(result['decoded_parameters'])}
+        for name, values in self._buffer.items():
+            value = result.get(name)
+            values.append(str(value) if value is not None and name in self._text_fields else value)
+        if len(self._buffer['transaction_hash']) >= self._flush_rows:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer['transaction_hash']:
+            self._writer.write_table(pa.Table.from_pydict(self._buffer, schema=self._schema))
+            self._buffer = {name: [] for name in self._buffer}
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+        print(f"\nAnalytics results saved to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ResultsCsvWriter(_BufferedResultsWriter):
+    """
+    Streams analytics results to a CSV file with pyarrow's CSV writer, which
+    formats whole columns in C instead of quoting and stringifying row by row.
+
+    Unlike the csv module, pyarrow quotes the header and every text cell
+    (e.g. "transitState", "True"), while integers and empty values stay unquoted.
+    Any CSV reader parses both layouts to the same values.
+    """
 
+    def __init__(self, results_dir: str, timestamp: int, field_dtypes: Dict[str, Any], flush_rows: int = 10_000):
+        results_csv_filename = f"{timestamp}_analytics_results.csv"
+        # every field but the integer timestamp is written as Python's str() of the value,
+        # so booleans and decoded parameters keep the text of earlier CSV output
+        schema = pa.schema([
+            (name, pa.int64() if dtype is np.int64 else pa.string())
+            for name, dtype in field_dtypes.items()
+        ])
+        super().__init__(os.path.join(results_dir, results_csv_filename), schema, flush_rows)
+
+    def _open_writer(self) -> pacsv.CSVWriter:
+        return pacsv.CSVWriter(self.path, self._schema)
+
+
+class ResultsParquetWriter(_BufferedResultsWriter):
+    """
+    Streams analytics results to a Parquet file, writing one row group per flush.
+    """
 
+    def __init__(self, results_dir: str, timestamp: int, field_dtypes: Dict[str, Any], flush_rows: int = 10_000):
+        results_parquet_filename = f"{timestamp}_analytics_results.parquet"
+        # decoded parameters and token ids can hold integers beyond 64 bits, so object fields are stored as text
+        schema = pa.schema([
+            (name, pa.int64() if dtype is np.int64 else pa.bool_() if dtype is bool else pa.string())
+            for name, dtype in field_dtypes.items()
+        ])
+        super().__init__(os.path.join(results_dir, results_parquet_filename), schema, flush_rows)
+
+    def _open_writer(self) -> pq.ParquetWriter:
+        return pq.ParquetWriter(self.path, self._schema)
@@ -0,0 +1,315 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.types import TxData, TxReceipt
+from web3.middleware import ExtraDataToPOAMiddleware
+
+from src.rpc_async import RpcCallError, normalize_result, run_calls
+from src.rpc_cache import RpcCache
+
+
+@lru_cache(maxsize=None)
+def get_w3(rpc_url: str, poa: bool, pool_size: int) -> Web3:
+    """
+    Returns a Web3 client for the given RPC URL, built once per process.
+
+    The provider shares a single requests.Session whose connection pool is
+    sized to the number of workers, so keep-alive connections are reused
+    across calls instead of being re-established.
+
+    Args:
+        rpc_url: The HTTP(S) RPC endpoint.
+        poa: If True, inject the Proof-of-Authority extraData middleware.
+        pool_size: Number of pooled connections to keep per host.
+
+    Returns:
+        A memoized Web3 client instance.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        # JSON-RPC reads are idempotent, so POST requests are safe to retry
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=None)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    w3 = Web3(Web3.HTTPProvider(rpc_url, session=session))
+    if poa:
+        w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    return w3
+
+
+# Number of JSON-RPC calls sent in a single batched HTTP request
+RPC_BATCH_SIZE = 100
+
+# Block timestamps never change once mined, so they are kept for the rest of the process.
+# Sized to cover the working set of blocks of a typical CSV run.
+BLOCK_TIMESTAMP_CACHE_SIZE = 8192
+_block_timestamp_cache: "OrderedDict[Tuple[str, int], int]" = OrderedDict()
+
+
+def _get_cached_block_timestamp(rpc_url: str, block_number: int) -> Optional[int]:
+    key = (rpc_url, block_number)
+    timestamp = _block_timestamp_cache.get(key)
+    if timestamp is not None:
+        _block_timestamp_cache.move_to_end(key)
+    return timestamp
+
+
+def _cache_block_timestamp(rpc_url: str, block_number: int, timestamp: int) -> None:
+    key = (rpc_url, block_number)
+    _block_timestamp_cache[key] = timestamp
+    _block_timestamp_cache.move_to_end(key)
+    if len(_block_timestamp_cache) > BLOCK_TIMESTAMP_CACHE_SIZE:
+        _block_timestamp_cache.popitem(last=False)
+
+
+def batch_get_transactions(
+    rpc_url: str,
+    tx_hashes: List[HexBytes],
+    batch_size: int = RPC_BATCH_SIZE,
+    max_concurrency: int = 1,
+    cache: Optional[RpcCache] = None,
+    verbose: bool = False
+) -> Dict[HexBytes, Union[TxData, RpcCallError, None]]:
+    """
+    Fetches transactions using concurrent JSON-RPC batch requests.
+
+    Args:
+        rpc_url: The HTTP(S) RPC endpoint.
+        tx_hashes: Transaction hashes to fetch, as bytes.
+        batch_size: Number of eth_getTransactionByHash calls per HTTP request.
+        max_concurrency: Maximum number of batch requests in flight at once.
+        cache: Optional on-disk cache, checked first and filled with the mined transactions fetched.
+        verbose: If True, report batches that had to fall back to single calls.
+
+    Returns:
+        Dictionary mapping each hash to its transaction, None if the node does not know it,
+        or an RpcCallError if it could not be fetched.
+    """
+    raw_transactions: Dict[HexBytes, Union[dict, RpcCallError, None]] = cache.get_transactions(tx_hashes) if cache else {}
+    missing_hashes = [tx_hash for tx_hash in tx_hashes if tx_hash not in raw_transactions]
+
+    calls = [("eth_getTransactionByHash", [tx_hash.to_0x_hex()]) for tx_hash in missing_hashes]
+    fetched = list(zip(missing_hashes, run_calls(rpc_url, calls, batch_size, max_concurrency, normalize=False, verbose=verbose)))
+    if cache:
+        # pending transactions can still change, only mined ones are stored
+        cache.put_transactions((
+            (tx_hash, tx) for tx_hash, tx in fetched if isinstance(tx, dict) and tx.get('blockNumber') is not None
+        ))
+    raw_transactions.update(fetched)
+    return {tx_hash: normalize_result(raw_transactions.get(tx_hash)) for tx_hash in tx_hashes}
+
+
+def batch_get_block_timestamps(
+    rpc_url: str,
+    block_numbers: Iterable[int],
+    batch_size: int = RPC_BATCH_SIZE,
+    max_concurrency: int = 1,
+    cache: Optional[RpcCache] = None,
+    verbose: bool = False
+) -> Dict[int, Optional[int]]:
+    """
+    Fetches block timestamps using concurrent JSON-RPC batch requests.
+    Each block is requested once, no matter how many transactions it contains,
+    blocks already seen by this process are served from memory and, when a
+    cache is given, blocks seen by earlier runs are served from disk.
+
+    Args:
+        rpc_url: The HTTP(S) RPC endpoint.
+        block_numbers: Block numbers to fetch.
+        batch_size: Number of eth_getBlockByNumber calls per HTTP request.
+        max_concurrency: Maximum number of batch requests in flight at once.
+        cache: Optional on-disk cache, checked after memory and filled with the timestamps fetched.
+        verbose: If True, report batches that had to fall back to single calls.
+
+    Returns:
+        Dictionary mapping each block number to its timestamp, or None if it could not be fetched.
+    """
+    timestamps: Dict[int, Optional[int]] = {}
+    missing_blocks: List[int] = []
+    for block_number in sorted(set(block_numbers)):
+        cached_timestamp = _get_cached_block_timestamp(rpc_url, block_number)
+        if cached_timestamp is not None:
+            timestamps[block_number] = cached_timestamp
+        else:
+            missing_blocks.append(block_number)
+
+    if cache and missing_blocks:
+        disk_timestamps = cache.get_block_timestamps(missing_blocks)
+        for block_number, timestamp in disk_timestamps.items():
+            timestamps[block_number] = timestamp
+            _cache_block_timestamp(rpc_url, block_number, timestamp)
+        missing_blocks = [block_number for block_number in missing_blocks if block_number not in disk_timestamps]
+
+    # header only (False), the transaction hashes are not needed here
+    calls = [("eth_getBlockByNumber", [hex(block_number), False]) for block_number in missing_blocks]
+    blocks = run_calls(rpc_url, calls, batch_size, max_concurrency, verbose=verbose)
+    fetched_timestamps: List[Tuple[int, int]] = []
+    for block_number, block in zip(missing_blocks, blocks):
+        timestamp = block.get('timestamp') if isinstance(block, dict) else None
+        timestamps[block_number] = timestamp
+        if timestamp is not None:
+            _cache_block_timestamp(rpc_url, block_number, timestamp)
+            fetched_timestamps.append((block_number, timestamp))
+    if cache:
+        cache.put_block_timestamps(fetched_timestamps)
+    return timestamps
+
+
+# Blocks with full transaction objects are large, so fewer of them go into one batch
+FULL_BLOCK_BATCH_SIZE = 10
+
+
+def batch_get_blocks_with_transactions(
+    rpc_url: str,
+    block_numbers: Iterable[int],
+    tx_hashes: Iterable[HexBytes],
+    batch_size: int = FULL_BLOCK_BATCH_SIZE,
+    max_concurrency: int = 1,
+    cache: Optional[RpcCache] = None,
+    verbose: bool = False
+) -> Tuple[Dict[HexBytes, TxData], Dict[int, Optional[int]]]:
+    """
+    Fetches blocks with their full transaction objects using concurrent JSON-RPC batch requests,
+    keeping only the wanted transactions and each block's timestamp.
+
+    When the wanted hashes cluster into few blocks, this replaces one
+    eth_getTransactionByHash per hash plus one eth_getBlockByNumber per block
+    with a single eth_getBlockByNumber per block.
+
+    Args:
+        rpc_url: The HTTP(S) RPC endpoint.
+        block_numbers: Block numbers containing the wanted transactions.
+        tx_hashes: Hashes of the wanted transactions, as bytes.
+        batch_size: Number of eth_getBlockByNumber calls per HTTP request.
+        max_concurrency: Maximum number of batch requests in flight at once.
+        cache: Optional on-disk cache. If it already holds every wanted transaction, no block
+            is fetched (and no timestamps are returned); otherwise it is filled with the
+            wanted transactions and the timestamps fetched.
+        verbose: If True, report batches that had to fall back to single calls.
+
+    Returns:
+        A tuple of (hash -> transaction for every wanted transaction found in the blocks,
+        block number -> timestamp, or None if the block could not be fetched).
+    """
+    wanted_hashes = list(dict.fromkeys(tx_hashes))
+    sorted_blocks = sorted(set(block_numbers))
+
+    # without a block per hash mapping, blocks are only skipped when nothing is left to find in them
+    cached_transactions = cache.get_transactions(wanted_hashes) if cache else {}
+    if cached_transactions and len(cached_transactions) == len(wanted_hashes):
+        return {tx_hash: normalize_result(tx) for tx_hash, tx in cached_transactions.items()}, {}
+
+    calls = [("eth_getBlockByNumber", [hex(block_number), True]) for block_number in sorted_blocks]
+    blocks = run_calls(rpc_url, calls, batch_size, max_concurrency, normalize=False, verbose=verbose)
+
+    wanted_hash_set = set(wanted_hashes)
+    raw_transactions: List[Tuple[HexBytes, dict]] = []
+    timestamps: Dict[int, Optional[int]] = {}
+    for block_number, block in zip(sorted_blocks, blocks):
+        # failed blocks are left to the per-hash transaction fetch
+        timestamp = int(block['timestamp'], 16) if isinstance(block, dict) and block.get('timestamp') else None
+        timestamps[block_number] = timestamp
+        if timestamp is None:
+            continue
+        _cache_block_timestamp(rpc_url, block_number, timestamp)
+        for tx in block['transactions']:
+            tx_hash = HexBytes(tx['hash'])
+            if tx_hash in wanted_hash_set:
+                raw_transactions.append((tx_hash, tx))
+
+    if cache:
+        cache.put_transactions(raw_transactions)
+        cache.put_block_timestamps([(number, timestamp) for number, timestamp in timestamps.items() if timestamp is not None])
+    return {tx_hash: normalize_result(tx) for tx_hash, tx in raw_transactions}, timestamps
+
+
+# eth_getBlockReceipts is only used for blocks holding at least this many wanted transactions,
+# below that the receipts of the other transactions in the block would be fetched for nothing
+BLOCK_RECEIPTS_MIN_TRANSACTIONS = 2
+
+
+def batch_get_receipts(
+    rpc_url: str,
+    tx_hashes_by_block: Dict[int, List[HexBytes]],
+    batch_size: int = RPC_BATCH_SIZE,
+    max_concurrency: int = 1,
+    cache: Optional[RpcCache] = None,
+    verbose: bool = False
+) -> Dict[HexBytes, Union[TxReceipt, RpcCallError, None]]:
+    """
+    Fetches transaction receipts using concurrent JSON-RPC batch requests.
+
+    Blocks holding several wanted transactions are fetched with a single
+    eth_getBlockReceipts call each. The remaining transactions, and the
+    transactions of blocks the node could not return receipts for (the method
+    is not supported by every client), use batched eth_getTransactionReceipt calls.
+
+    Args:
+        rpc_url: The HTTP(S) RPC endpoint.
+        tx_hashes_by_block: Wanted transaction hashes, as bytes, grouped by block number.
+        batch_size: Number of calls per HTTP request.
+        max_concurrency: Maximum number of batch requests in flight at once.
+        cache: Optional on-disk cache, checked first and filled with the receipts fetched.
+        verbose: If True, report batches that had to fall back to other calls.
+
+    Returns:
+        Dictionary mapping each hash to its receipt, None if the node does not know it,
+        or an RpcCallError if it could not be fetched.
+    """
+    all_hashes = [tx_hash for block_hashes in tx_hashes_by_block.values() for tx_hash in block_hashes]
+    raw_receipts: Dict[HexBytes, Union[dict, RpcCallError, None]] = cache.get_receipts(all_hashes) if cache else {}
+    if raw_receipts:
+        uncached_hashes_by_block: Dict[int, List[HexBytes]] = {}
+        for block_number, block_hashes in tx_hashes_by_block.items():
+            uncached_hashes = [tx_hash for tx_hash in block_hashes if tx_hash not in raw_receipts]
+            if uncached_hashes:
+                uncached_hashes_by_block[block_number] = uncached_hashes
+        tx_hashes_by_block = uncached_hashes_by_block
+    fetched_receipts: List[Tuple[HexBytes, dict]] = []
+
+    dense_blocks = sorted(
+        block_number for block_number, block_hashes in tx_hashes_by_block.items()
+        if len(block_hashes) >= BLOCK_RECEIPTS_MIN_TRANSACTIONS
+    )
+
+    # a rejected batch usually means an unsupported method, so its blocks are not retried one by one
+    calls = [("eth_getBlockReceipts", [hex(block_number)]) for block_number in dense_blocks]
+    block_receipts = run_calls(
+        rpc_url, calls, batch_size, max_concurrency, retry_single_calls=False, normalize=False, verbose=verbose
+    )
+    found_hashes = set()
+    for block_number, block_receipt_list in zip(dense_blocks, block_receipts):
+        if not isinstance(block_receipt_list, list):
+            continue
+        wanted_hashes = set(tx_hashes_by_block[block_number])
+        for receipt in block_receipt_list:
+            tx_hash = HexBytes(receipt['transactionHash'])
+            if tx_hash in wanted_hashes:
+                fetched_receipts.append((tx_hash, receipt))
+                found_hashes.add(tx_hash)
+
+    missing_hashes = [
+        tx_hash for block_hashes in tx_hashes_by_block.values() for tx_hash in block_hashes
+        if tx_hash not in found_hashes
+    ]
+    calls = [("eth_getTransactionReceipt", [tx_hash.to_0x_hex()]) for tx_hash in missing_hashes]
+    single_receipts = run_calls(rpc_url, calls, batch_size, max_concurrency, normalize=False, verbose=verbose)
+    single_results = list(zip(missing_hashes, single_receipts))
+    fetched_receipts.extend((tx_hash, receipt) for tx_hash, receipt in single_results if isinstance(receipt, dict))
+
+    if cache:
+        cache.put_receipts(fetched_receipts)
+    # failures are returned as well, so they are not mistaken for receipts the node does not have
+    raw_receipts.update((tx_hash, receipt) for tx_hash, receipt in single_results if isinstance(receipt, RpcCallError))
+    raw_receipts.update(fetched_receipts)
+    return {tx_hash: normalize_result(raw_receipts.get(tx_hash)) for tx_hash in all_hashes}
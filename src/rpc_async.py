@@ -0,0 +1,303 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import orjson
+from hexbytes import HexBytes
+
+# (method, params) of one JSON-RPC call
+RpcCall = Tuple[str, List[Any]]
+
+# hex encoded integer fields of transactions, receipts, logs and blocks
+_QUANTITY_FIELDS = frozenset({
+    'blockNumber', 'transactionIndex', 'logIndex', 'nonce', 'gas', 'gasPrice', 'value',
+    'maxFeePerGas', 'maxPriorityFeePerGas', 'chainId', 'type', 'v', 'yParity',
+    'cumulativeGasUsed', 'gasUsed', 'effectiveGasPrice', 'status', 'number', 'timestamp',
+})
+# hex encoded byte string fields
+_BYTES_FIELDS = frozenset({
+    'hash', 'blockHash', 'transactionHash', 'input', 'data', 'r', 's',
+})
+# lists of hex encoded byte strings, or of nested objects to normalize
+_LIST_FIELDS = frozenset({'topics', 'logs', 'transactions'})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# HTTP statuses worth retrying: rate limiting and transient server or gateway errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# attempts per HTTP request, including the first one
+RPC_MAX_ATTEMPTS = 5
+# delay before the first retry, doubled for every further retry
+RPC_BACKOFF_SECONDS = 0.5
+# upper bound for a single retry delay, including one asked for by a Retry-After header
+RPC_MAX_BACKOFF_SECONDS = 30.0
+# total time allowed for one HTTP request
+RPC_TIMEOUT_SECONDS = 60
+
+
+class RpcCallError(Exception):
+    """
+    A JSON-RPC call that could not be completed (HTTP, network or JSON-RPC error).
+
+    Failed calls are returned as instances of this class instead of being raised, so that
+    callers can tell them apart from a None result, which means the node found nothing.
+    """
+
+
+def normalize_result(value: Any) -> Any:
+    """
+    Converts a raw JSON-RPC result into the types web3.py would return for the fields used here:
+    quantities become ints and hashes, input data and log topics become HexBytes.
+    Addresses are left as the lowercase strings sent by the node.
+
+    Args:
+        value: A decoded JSON-RPC result (a transaction, receipt or block object, or a list of them).
+
+    Returns:
+        The normalized result.
+    """
+    if isinstance(value, list):
+        return [normalize_result(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    normalized: Dict[str, Any] = {}
+    for name, item in value.items():
+        if item is None:
+            normalized[name] = None
+        elif name in _QUANTITY_FIELDS and isinstance(item, str):
+            normalized[name] = int(item, 16)
+        elif name in _BYTES_FIELDS and isinstance(item, str):
+            normalized[name] = HexBytes(item)
+        elif name in _LIST_FIELDS and isinstance(item, list):
+            # 'transactions' holds hashes or full objects, depending on the request
+            normalized[name] = [HexBytes(entry) if isinstance(entry, str) else normalize_result(entry) for entry in item]
+        else:
+            normalized[name] = item
+    return normalized
+
+
+async def _post_json(session: aiohttp.ClientSession, rpc_url: str, payload: Any) -> Any:
+    """
+    POSTs a JSON-RPC payload and returns the decoded response body, retrying rate limited,
+    transient server and network failures with exponential backoff.
+
+    Raises:
+        aiohttp.ClientError, asyncio.TimeoutError: If the request still fails after RPC_MAX_ATTEMPTS attempts.
+    """
+    data = orjson.dumps(payload)
+    for attempt in range(RPC_MAX_ATTEMPTS - 1):
+        delay = RPC_BACKOFF_SECONDS * 2 ** attempt
+        try:
+            async with session.post(rpc_url, data=data, headers=_JSON_HEADERS) as response:
+                if response.status not in RETRYABLE_STATUSES:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+            pass
+        await asyncio.sleep(min(delay, RPC_MAX_BACKOFF_SECONDS))
+
+    # last attempt, any failure is raised to the caller
+    async with session.post(rpc_url, data=data, headers=_JSON_HEADERS) as response:
+        response.raise_for_status()
+        return orjson.loads(await response.read())
+
+
+async def jsonrpc_call(session: aiohttp.ClientSession, rpc_url: str, method: str, params: List[Any]) -> Any:
+    """
+    Sends a single JSON-RPC call.
+
+    Args:
+        session: The shared aiohttp session.
+        rpc_url: The HTTP(S) RPC endpoint.
+        method: JSON-RPC method name, e.g. "eth_getTransactionByHash".
+        params: JSON-RPC parameters.
+
+    Returns:
+        The raw result, see normalize_result.
+
+    Raises:
+        RpcCallError: If the node answers with a JSON-RPC error.
+        aiohttp.ClientError, asyncio.TimeoutError: If the request fails after all retries.
+    """
+    payload = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params}
+    body = await _post_json(session, rpc_url, payload)
+    if body.get("error"):
+        raise RpcCallError(f"{method} failed: {body['error']}")
+    return body.get("result")
+
+
+async def jsonrpc_batch(session: aiohttp.ClientSession, rpc_url: str, calls: List[RpcCall]) -> List[Optional[Any]]:
+    """
+    Sends several JSON-RPC calls in one HTTP request.
+
+    Unlike web3.py batches, a call answered with an error only yields an
+    RpcCallError for that call instead of failing the whole batch.
+
+    Args:
+        session: The shared aiohttp session.
+        rpc_url: The HTTP(S) RPC endpoint.
+        calls: The (method, params) calls to send.
+
+    Returns:
+        The raw result of every call, in call order, or an RpcCallError for calls that failed.
+
+    Raises:
+        ValueError: If the node rejects the batch as a whole (e.g. batching is not supported).
+        aiohttp.ClientError, asyncio.TimeoutError: If the request fails after all retries.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": call_id, "method": method, "params": params}
+        for call_id, (method, params) in enumerate(calls)
+    ]
+    # orjson encodes and parses the (large) batch bodies much faster than the stdlib json used by json=
+    body = await _post_json(session, rpc_url, payload)
+    if not isinstance(body, list):
+        raise ValueError(f"Batch request rejected: {body.get('error') if isinstance(body, dict) else body}")
+
+    # responses may come back in any order, they are matched by id
+    results: List[Any] = [RpcCallError(f"{method}: no response in batch") for method, _ in calls]
+    for item in body:
+        call_id = item.get("id")
+        if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+            continue
+        if item.get("error"):
+            results[call_id] = RpcCallError(f"{calls[call_id][0]} failed: {item['error']}")
+        else:
+            results[call_id] = item.get("result")
+    return results
+
+
+async def _run_batch_or_single_calls(
+    session: aiohttp.ClientSession,
+    rpc_url: str,
+    calls: List[RpcCall],
+    retry_single_calls: bool,
+    verbose: bool
+) -> List[Any]:
+    try:
+        return await jsonrpc_batch(session, rpc_url, calls)
+    except ValueError as e:
+        # the node answered, but rejected the batch itself (e.g. batching is not supported)
+        if not retry_single_calls:
+            if verbose:
+                print(f"\nBatch request of {len(calls)} {calls[0][0]} calls failed ({e}).")
+            return [RpcCallError(f"{method}: batch request failed: {e}") for method, _ in calls]
+        if verbose:
+            print(f"\nBatch request failed ({e}), retrying {len(calls)} {calls[0][0]} calls individually.")
+    except Exception as e:
+        # HTTP, network or timeout failure that outlasted every retry: re-sending the calls
+        # one by one would only multiply the requests to a node that is throttling or down
+        if verbose:
+            print(f"\nBatch request of {len(calls)} {calls[0][0]} calls failed after retries ({e!r}).")
+        return [RpcCallError(f"{method}: batch request failed: {e!r}") for method, _ in calls]
+
+    results: List[Any] = []
+    for call_index, (method, params) in enumerate(calls):
+        try:
+            results.append(await jsonrpc_call(session, rpc_url, method, params))
+        except RpcCallError as e:
+            results.append(e)
+        except Exception as e:
+            # same as above, the remaining calls are failed without being sent
+            results.extend(RpcCallError(f"{remaining_method} failed: {e!r}") for remaining_method, _ in calls[call_index:])
+            break
+    return results
+
+
+# one event loop and one aiohttp session per connection limit, kept for the whole process,
+# so the transaction, block and receipt phases reuse the same keep-alive connections
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_sessions: Dict[int, aiohttp.ClientSession] = {}
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
+async def _get_session(max_concurrency: int) -> aiohttp.ClientSession:
+    session = _sessions.get(max_concurrency)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=max_concurrency)
+        session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT_SECONDS))
+        _sessions[max_concurrency] = session
+    return session
+
+
+async def _run_calls(
+    rpc_url: str,
+    calls: List[RpcCall],
+    batch_size: int,
+    max_concurrency: int,
+    retry_single_calls: bool,
+    verbose: bool
+) -> List[Optional[Any]]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    session = await _get_session(max_concurrency)
+
+    async def run_chunk(chunk: List[RpcCall]) -> List[Optional[Any]]:
+        async with semaphore:
+            return await _run_batch_or_single_calls(session, rpc_url, chunk, retry_single_calls, verbose)
+
+    chunk_results = await asyncio.gather(*(
+        run_chunk(calls[start:start + batch_size]) for start in range(0, len(calls), batch_size)
+    ))
+    return [result for chunk_result in chunk_results for result in chunk_result]
+
+
+def run_calls(
+    rpc_url: str,
+    calls: List[RpcCall],
+    batch_size: int,
+    max_concurrency: int = 1,
+    retry_single_calls: bool = True,
+    normalize: bool = True,
+    verbose: bool = False
+) -> List[Optional[Any]]:
+    """
+    Runs JSON-RPC calls in batches of batch_size, with at most max_concurrency
+    batches in flight at once over one shared aiohttp connection pool.
+    Rate limited (429), transient server (5xx) and network failures are retried
+    with exponential backoff before a call is reported as failed.
+    The pool stays open between calls until close_sessions is called.
+
+    Args:
+        rpc_url: The HTTP(S) RPC endpoint.
+        calls: The (method, params) calls to run.
+        batch_size: Number of calls per HTTP request.
+        max_concurrency: Maximum number of batch requests in flight at once.
+        retry_single_calls: If True, a batch rejected as a whole is retried call by call,
+            otherwise all of its calls yield an RpcCallError.
+        normalize: If True, results are converted by normalize_result, otherwise they are
+            returned as sent by the node (e.g. to be stored as JSON).
+        verbose: If True, report batches that failed.
+
+    Returns:
+        The result of every call, in call order. A None result means the node found nothing,
+        calls that could not be completed yield an RpcCallError instead.
+    """
+    if not calls:
+        return []
+    results = _get_event_loop().run_until_complete(
+        _run_calls(rpc_url, calls, batch_size, max_concurrency, retry_single_calls, verbose)
+    )
+    return normalize_result(results) if normalize else results
+
+
+def close_sessions() -> None:
+    """Closes the pooled aiohttp sessions and their event loop, once all RPC prefetching is done."""
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        return
+    for session in _sessions.values():
+        if not session.closed:
+            _event_loop.run_until_complete(session.close())
+    _sessions.clear()
+    _event_loop.close()
+    _event_loop = None
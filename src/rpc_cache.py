@@ -0,0 +1,133 @@
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Tuple
+
+import orjson
+from hexbytes import HexBytes
+
+# SQLite builds need at least 999 bound parameters per statement, lookups stay below that
+_LOOKUP_CHUNK_SIZE = 500
+
+# bumped whenever the table layout changes; caches written with another layout are discarded
+_SCHEMA_VERSION = 3
+
+
+class RpcCache:
+    """
+    On-disk cache of RPC responses that cannot change once their block is mined.
+
+    Transactions and receipts are stored as the raw JSON-RPC result. Every entry
+    is keyed by chain id as well as by transaction hash or block number, so
+    switching networks never serves rows fetched from another chain, while
+    different endpoints of the same chain share their entries. RPC URLs, which
+    often embed provider API keys, are never written to the file.
+
+    With read_enabled=False lookups always miss, while fetched responses are
+    still written, which refreshes the cache.
+    """
+
+    def __init__(self, cache_dir: str, chain_id: int, read_enabled: bool = True):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "rpc_cache.sqlite3")
+        self.chain_id = chain_id
+        self.read_enabled = read_enabled
+        self._connection = sqlite3.connect(self.path)
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            self._connection.executescript(
+                f"""
+                DROP TABLE IF EXISTS transactions;
+                DROP TABLE IF EXISTS receipts;
+                DROP TABLE IF EXISTS block_timestamps;
+                PRAGMA user_version = {_SCHEMA_VERSION};
+                """
+            )
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS transactions (
+                chain_id INTEGER NOT NULL,
+                hash BLOB NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (chain_id, hash)
+            );
+            CREATE TABLE IF NOT EXISTS receipts (
+                chain_id INTEGER NOT NULL,
+                hash BLOB NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (chain_id, hash)
+            );
+            CREATE TABLE IF NOT EXISTS block_timestamps (
+                chain_id INTEGER NOT NULL,
+                number INTEGER NOT NULL,
+                timestamp INTEGER NOT NULL,
+                PRIMARY KEY (chain_id, number)
+            );
+            """
+        )
+
+    def _get_by_hash(self, table: str, tx_hashes: List[HexBytes]) -> Dict[HexBytes, Any]:
+        found: Dict[HexBytes, Any] = {}
+        if not self.read_enabled:
+            return found
+        for start in range(0, len(tx_hashes), _LOOKUP_CHUNK_SIZE):
+            chunk = [bytes(tx_hash) for tx_hash in tx_hashes[start:start + _LOOKUP_CHUNK_SIZE]]
+            rows = self._connection.execute(
+                f"SELECT hash, data FROM {table} WHERE chain_id = ? AND hash IN ({','.join('?' * len(chunk))})",
+                [self.chain_id, *chunk]
+            )
+            for tx_hash, data in rows:
+                found[HexBytes(tx_hash)] = orjson.loads(data)
+        return found
+
+    def _put_by_hash(self, table: str, items: Iterable[Tuple[HexBytes, Any]]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {table} (chain_id, hash, data) VALUES (?, ?, ?)",
+                ((self.chain_id, bytes(tx_hash), orjson.dumps(data)) for tx_hash, data in items)
+            )
+
+    def get_transactions(self, tx_hashes: List[HexBytes]) -> Dict[HexBytes, Any]:
+        """Returns the cached raw transactions among tx_hashes, keyed by hash."""
+        return self._get_by_hash("transactions", tx_hashes)
+
+    def put_transactions(self, items: Iterable[Tuple[HexBytes, Any]]) -> None:
+        """Stores (hash, raw transaction) pairs. Only mined transactions should be stored."""
+        self._put_by_hash("transactions", items)
+
+    def get_receipts(self, tx_hashes: List[HexBytes]) -> Dict[HexBytes, Any]:
+        """Returns the cached raw receipts among tx_hashes, keyed by transaction hash."""
+        return self._get_by_hash("receipts", tx_hashes)
+
+    def put_receipts(self, items: Iterable[Tuple[HexBytes, Any]]) -> None:
+        """Stores (transaction hash, raw receipt) pairs."""
+        self._put_by_hash("receipts", items)
+
+    def get_block_timestamps(self, block_numbers: List[int]) -> Dict[int, int]:
+        """Returns the cached timestamps among block_numbers, keyed by block number."""
+        found: Dict[int, int] = {}
+        if not self.read_enabled:
+            return found
+        for start in range(0, len(block_numbers), _LOOKUP_CHUNK_SIZE):
+            chunk = block_numbers[start:start + _LOOKUP_CHUNK_SIZE]
+            rows = self._connection.execute(
+                f"SELECT number, timestamp FROM block_timestamps WHERE chain_id = ? AND number IN ({','.join('?' * len(chunk))})",
+                [self.chain_id, *chunk]
+            )
+            found.update(rows)
+        return found
+
+    def put_block_timestamps(self, items: Iterable[Tuple[int, int]]) -> None:
+        """Stores (block number, timestamp) pairs."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO block_timestamps (chain_id, number, timestamp) VALUES (?, ?, ?)",
+                ((self.chain_id, block_number, timestamp) for block_number, timestamp in items)
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "RpcCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,32 @@
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# columns holding hex strings, which must never go through type inference:
+# pyarrow would read a column of short hashes or raw selectors (e.g. '0x6bb4b2e9') as integers
+TEXT_COLUMNS = ('Transaction Hash', 'Method')
+
+
+def read_transactions_csv(csv_path: str, columns: List[str]) -> pd.DataFrame:
+    """
+    Reads the given columns of a block explorer transactions export with pyarrow's CSV reader.
+
+    Text columns are typed as strings at read time, so hex values keep their exact
+    spelling, and are returned as Arrow-backed pandas strings. Empty cells are missing values.
+
+    Args:
+        csv_path: Path to the transactions CSV file.
+        columns: Names of the columns to read; any other column is never parsed.
+
+    Returns:
+        A DataFrame with the requested columns, in the order given by columns.
+    """
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns,
+        column_types={column: pa.string() for column in TEXT_COLUMNS if column in columns},
+        strings_can_be_null=True
+    )
+    table = pacsv.read_csv(csv_path, convert_options=convert_options)
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
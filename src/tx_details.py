@@ -1,21 +1,230 @@
-from web3 import Web3
+import concurrent.futures
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+import orjson
+from eth_abi import decode as abi_decode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
 from hexbytes import HexBytes
-from typing import Dict, Any, Tuple, Optional, Union
+from typing import Callable, Dict, Any, List, Tuple, Optional, Union
+
+# (function name, canonical argument types, argument names) for one ABI function
+FunctionDecoder = Tuple[str, Tuple[str, ...], List[str]]
+# 4-byte function selector -> decoder entry
+SelectorTable = Dict[bytes, FunctionDecoder]
+
+# eth_abi decodes 'address' arguments to lowercase, 0x-prefixed hex strings
+_DECODED_ADDRESS_PATTERN = re.compile(r"0x[0-9a-f]{40}")
+
+# an ABI type held in a single 32-byte word, optionally in fixed-size arrays, e.g. 'uint256[2][2]'
+_STATIC_WORD_TYPE_PATTERN = re.compile(r"(uint|int|address|bool|bytes)(\d*)((?:\[\d+\])*)")
+_ZERO_PADDING = bytes(32)
+
+
+@lru_cache(maxsize=16)
+def load_contract_abi(abi_json_path: str, mtime: float) -> list:
+    """
+    Loads and parses a contract ABI JSON file.
+
+    Results are memoized by path and modification time, so repeated runs in the
+    same process only re-parse the file after it has changed.
+
+    Args:
+        abi_json_path: Path to the ABI JSON file.
+        mtime: The file's modification time (os.stat(path).st_mtime), used as the cache key.
+
+    Returns:
+        The parsed ABI, as a list. Callers must not modify it, since it is shared.
+    """
+    return orjson.loads(Path(abi_json_path).read_bytes())
+
+
+def _canonical_type(abi_input: Dict[str, Any]) -> str:
+    """Returns the canonical ABI type of an input, expanding tuples into their component types."""
+    abi_type = abi_input['type']
+    if abi_type.startswith('tuple'):
+        components = ','.join(_canonical_type(component) for component in abi_input.get('components', []))
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+def build_selector_table(contract_abi: list) -> SelectorTable:
+    """
+    Builds a lookup table from 4-byte function selectors to their argument types and names.
+
+    The table is built once per run, so decoding a transaction is a dictionary
+    lookup followed by a single eth_abi decode call instead of a scan over the ABI.
+
+    Args:
+        contract_abi: The ABI of the contract called in the transactions, as a list.
+
+    Returns:
+        Dictionary mapping each function selector (bytes) to its name, argument types and argument names.
+    """
+    selector_table: SelectorTable = {}
+    for entry in contract_abi:
+        if entry.get('type') != 'function':
+            continue
+        inputs = entry.get('inputs', [])
+        types = tuple(_canonical_type(abi_input) for abi_input in inputs)
+        names = [abi_input.get('name') or f"arg{i}" for i, abi_input in enumerate(inputs)]
+        signature = f"{entry['name']}({','.join(types)})"
+        selector_table[function_signature_to_4byte_selector(signature)] = (entry['name'], types, names)
+    return selector_table
+
+
+@lru_cache(maxsize=16)
+def load_selector_table(abi_json_path: str, mtime: float) -> SelectorTable:
+    """
+    Loads a contract ABI file and builds its selector table.
+
+    Like load_contract_abi, results are memoized by path and modification time,
+    so the selector hashing runs once per ABI version rather than once per run.
+
+    Args:
+        abi_json_path: Path to the ABI JSON file.
+        mtime: The file's modification time (os.stat(path).st_mtime), used as the cache key.
+
+    Returns:
+        The selector table, see build_selector_table. Callers must not modify it, since it is shared.
+    """
+    return build_selector_table(load_contract_abi(abi_json_path, mtime))
+
+
+def target_selectors(selector_table: SelectorTable, function_names: List[str]) -> frozenset:
+    """
+    Returns the selectors of the given functions, so inputs calling anything else
+    can be rejected by comparing their first 4 bytes, without an ABI decode.
+
+    Args:
+        selector_table: The table built by build_selector_table from the contract ABI.
+        function_names: Names of the functions whose parameters are needed.
+
+    Returns:
+        A frozenset of the matching 4-byte selectors (bytes).
+    """
+    return frozenset(
+        selector for selector, (fn_name, _, _) in selector_table.items() if fn_name in function_names
+    )
+
+
+def _word_decoder(base_type: str, size: str) -> Optional[Callable[[bytes], Any]]:
+    """
+    Returns a decoder for one 32-byte word of the given elementary type, producing the same
+    value as eth_abi, or None if the type is not supported. Decoders raise ValueError on
+    malformed padding, like eth_abi's strict mode.
+    """
+    if base_type == 'uint':
+        bits = int(size or 256)
+
+        def decode_uint(word: bytes) -> int:
+            value = int.from_bytes(word, 'big')
+            if value >> bits:
+                raise ValueError(f"uint{bits} value out of bounds")
+            return value
+        return decode_uint
+    if base_type == 'int':
+        bits = int(size or 256)
+        bound = 1 << (bits - 1)
+
+        def decode_int(word: bytes) -> int:
+            value = int.from_bytes(word, 'big', signed=True)
+            if not -bound <= value < bound:
+                raise ValueError(f"int{bits} value out of bounds")
+            return value
+        return decode_int
+    if base_type == 'address' and not size:
+        def decode_address(word: bytes) -> str:
+            if word[:12] != _ZERO_PADDING[:12]:
+                raise ValueError("address value has non-zero padding")
+            return '0x' + word[12:].hex()
+        return decode_address
+    if base_type == 'bool' and not size:
+        def decode_bool(word: bytes) -> bool:
+            value = int.from_bytes(word, 'big')
+            if value > 1:
+                raise ValueError("bool value out of bounds")
+            return value == 1
+        return decode_bool
+    if base_type == 'bytes' and size and 1 <= int(size) <= 32:
+        length = int(size)
+
+        def decode_fixed_bytes(word: bytes) -> bytes:
+            if word[length:] != _ZERO_PADDING[length:]:
+                raise ValueError(f"bytes{length} value has non-zero padding")
+            return word[:length]
+        return decode_fixed_bytes
+    return None
+
+
+@lru_cache(maxsize=256)
+def _static_decoder(types: Tuple[str, ...]) -> Optional[Callable[[bytes], Tuple[Any, ...]]]:
+    """
+    Builds a decoder for argument lists made only of single-word types and fixed-size
+    arrays of them (e.g. 'transitState(uint256,uint256,uint256,bool,...)'), which reads
+    each value at its known offset instead of going through eth_abi's generic decoding.
+
+    Args:
+        types: Canonical argument types, as stored in the selector table.
+
+    Returns:
+        A function from the encoded arguments to the decoded values, or None if any type
+        is dynamic or unsupported, in which case eth_abi has to be used.
+    """
+    # (word decoder, array dimensions from innermost to outermost) per argument
+    plan: List[Tuple[Callable[[bytes], Any], List[int]]] = []
+    word_count = 0
+    for abi_type in types:
+        match = _STATIC_WORD_TYPE_PATTERN.fullmatch(abi_type)
+        if match is None:
+            return None
+        word_decoder = _word_decoder(match.group(1), match.group(2))
+        if word_decoder is None:
+            return None
+        dimensions = [int(dimension) for dimension in re.findall(r"\d+", match.group(3))]
+        if 0 in dimensions:
+            return None
+        words = 1
+        for dimension in dimensions:
+            words *= dimension
+        word_count += words
+        plan.append((word_decoder, dimensions))
+
+    def read(data: bytes, offset: int, word_decoder: Callable[[bytes], Any], dimensions: List[int]) -> Tuple[Any, int]:
+        if not dimensions:
+            return word_decoder(data[offset:offset + 32]), offset + 32
+        items = []
+        for _ in range(dimensions[-1]):
+            item, offset = read(data, offset, word_decoder, dimensions[:-1])
+            items.append(item)
+        return tuple(items), offset
+
+    def decode(data: bytes) -> Tuple[Any, ...]:
+        if len(data) < word_count * 32:
+            raise ValueError("input data is shorter than the function arguments")
+        values = []
+        offset = 0
+        for word_decoder, dimensions in plan:
+            value, offset = read(data, offset, word_decoder, dimensions)
+            values.append(value)
+        return tuple(values)
+
+    return decode
+
 
 def decode_transaction_input(
-    w3: Web3,
+    selector_table: SelectorTable,
     input_data: Union[HexBytes, str, None],
-    contract_abi: list,
     contract_address: str,
     verbose: bool = False
 ) -> Optional[Tuple[str, Dict[str, Any]]]:
     """
-    Decodes transaction input data using the contract ABI and address.
+    Decodes transaction input data using a prebuilt selector table.
 
     Args:
-        w3: An initialized web3.py client instance (used for utilities like checksumming).
+        selector_table: The table built by build_selector_table from the contract ABI.
         input_data: The raw transaction input data as HexBytes, a hex string, or None.
-        contract_abi: The ABI of the contract called in the transaction, as a list.
         contract_address: The address of the contract called in the transaction.
         verbose: If True, print more detailed information during processing.
 
@@ -30,27 +239,37 @@ def decode_transaction_input(
             return None
 
         try:
-            checksum_address = w3.to_checksum_address(contract_address)
-            contract = w3.eth.contract(address=checksum_address, abi=contract_abi)
-            if verbose:
-                print("  Contract instance created for decoding.")
-        except Exception as e:
-            print(f"Error creating contract instance for address {contract_address}. Check contract address and ABI: {e}")
-            return None
+            if isinstance(input_data, str):
+                # bytes.fromhex parses in C, without HexBytes' validation and wrapping
+                input_bytes = bytes.fromhex(input_data[2:] if input_data[:2] in ('0x', '0X') else input_data)
+            else:
+                input_bytes = bytes(input_data)
+            function_decoder = selector_table.get(input_bytes[:4])
+            if function_decoder is None:
+                if verbose:
+                    print(f"  Function selector 0x{input_bytes[:4].hex()} not found in the provided ABI.")
+                return None
 
-        try:
-            input_bytes = HexBytes(input_data) if isinstance(input_data, str) else input_data
-            func_obj, func_params = contract.decode_function_input(input_bytes)
+            fn_name, types, names = function_decoder
+            static_decoder = _static_decoder(types)
+            try:
+                # functions with only fixed-size arguments are read word by word, without eth_abi
+                values = static_decoder(input_bytes[4:]) if static_decoder is not None else None
+            except ValueError:
+                values = None
+            if values is None:
+                values = abi_decode(types, input_bytes[4:])
+            func_params = dict(zip(names, values))
 
             if verbose:
                 print(f"\n  --- Decoded Input Data ---")
-                print(f"  Function Called: {func_obj.fn_name}")
+                print(f"  Function Called: {fn_name}")
                 print("  Parameters:")
                 for name, value in func_params.items():
                     print(f"    {name}: {value}")
                 print("  ------------------------")
 
-            return func_obj.fn_name, func_params
+            return fn_name, func_params
 
         except Exception as e:
             if verbose:
@@ -61,3 +280,98 @@ def decode_transaction_input(
         print(f"An unexpected error occurred during decoding: {e}")
         return None
 
+
+# state of a decoding worker process, set once by init_decoder
+_worker_selector_table: SelectorTable = {}
+_worker_verbose: bool = False
+
+
+def init_decoder(selector_table: SelectorTable, verbose: bool = False) -> None:
+    """
+    Process pool initializer for decode_input_in_worker.
+    Stores the selector table once per worker process instead of sending it with every task.
+    """
+    global _worker_selector_table, _worker_verbose
+    _worker_selector_table = selector_table
+    _worker_verbose = verbose
+
+
+def decode_input_in_worker(item: Tuple[Union[HexBytes, str, None], str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Decodes one (input data, contract address) pair inside a process pool worker
+    set up by init_decoder. See decode_transaction_input for the return value.
+    """
+    input_data, contract_address = item
+    return decode_transaction_input(_worker_selector_table, input_data, contract_address, _worker_verbose)
+
+
+# below this many inputs, starting worker processes costs more than decoding inline
+DECODE_PARALLEL_MIN_ITEMS = 256
+
+
+def decode_many(
+    selector_table: SelectorTable,
+    items: List[Tuple[Union[HexBytes, str, None], str]],
+    workers: Optional[int] = None,
+    verbose: bool = False
+) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+    """
+    Decodes many (input data, contract address) pairs, spread over a process pool.
+
+    ABI decoding is pure Python CPU work, so it runs in processes rather than
+    GIL-bound threads. Small inputs are decoded inline.
+
+    Args:
+        selector_table: The table built by build_selector_table from the contract ABI.
+        items: The (input data, contract address) pairs to decode.
+        workers: Number of worker processes, defaults to the CPU count.
+        verbose: If True, print more detailed information during processing.
+
+    Returns:
+        The result of decode_transaction_input for every item, in item order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(items) < DECODE_PARALLEL_MIN_ITEMS:
+        return [
+            decode_transaction_input(selector_table, input_data, contract_address, verbose)
+            for input_data, contract_address in items
+        ]
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_decoder,
+        initargs=(selector_table, verbose)
+    ) as decode_executor:
+        return list(decode_executor.map(
+            decode_input_in_worker,
+            items,
+            chunksize=max(1, len(items) // (workers * 4))
+        ))
+
+
+@lru_cache(maxsize=4096)
+def _checksum_decoded_address(address: str) -> str:
+    return to_checksum_address(address)
+
+
+def checksum_decoded_addresses(value: Any) -> Any:
+    """
+    Converts the lowercase addresses produced by decoding into checksum addresses.
+
+    Decoding leaves addresses in their lowercase form so no keccak is spent on
+    values that are never written out; this is applied only when results are emitted.
+    Lists, tuples and dictionaries are converted recursively.
+
+    Args:
+        value: A decoded parameter value or a dictionary of decoded parameters.
+
+    Returns:
+        The same structure with every decoded address checksummed.
+    """
+    if isinstance(value, str):
+        return _checksum_decoded_address(value) if _DECODED_ADDRESS_PATTERN.fullmatch(value) else value
+    if isinstance(value, dict):
+        return {name: checksum_decoded_addresses(item) for name, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(checksum_decoded_addresses(item) for item in value)
+    return value
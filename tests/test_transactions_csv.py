@@ -0,0 +1,19 @@
+from src.transactions_csv import read_transactions_csv
+
+
+def test_hex_only_columns_are_read_as_strings(tmp_path):
+    csv_path = tmp_path / "transactions.csv"
+    csv_path.write_text(
+        '"Transaction Hash","Blockno","Method","Value"\n'
+        '0xaa,100,0x6bb4b2e9,1\n'
+        '0xbb,101,0x6bb4b2e9,2\n'
+        ',102,0x12345678,3\n'
+    )
+
+    df = read_transactions_csv(str(csv_path), ['Transaction Hash', 'Method', 'Blockno'])
+
+    assert list(df.columns) == ['Transaction Hash', 'Method', 'Blockno']
+    assert df['Method'].tolist() == ['0x6bb4b2e9', '0x6bb4b2e9', '0x12345678']
+    assert df['Transaction Hash'].iloc[:2].tolist() == ['0xaa', '0xbb']
+    assert df['Transaction Hash'].isna().tolist() == [False, False, True]
+    assert df['Blockno'].astype('int64').tolist() == [100, 101, 102]
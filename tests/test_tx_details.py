@@ -0,0 +1,130 @@
+import random
+import re
+
+import pytest
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector
+
+from src.tx_details import _static_decoder, build_selector_table, decode_transaction_input
+
+CONTRACT_ADDRESS = "0x" + "11" * 20
+
+
+def _function(name, *types):
+    return {
+        "type": "function",
+        "name": name,
+        "inputs": [{"name": f"p{i}", "type": abi_type} for i, abi_type in enumerate(types)],
+    }
+
+
+# Privado ID State.transitState, World ID registerIdentities (dynamic), and one function per
+# supported single-word type, including nested fixed-size arrays
+TEST_ABI = [
+    _function("transitState", "uint256", "uint256", "uint256", "bool", "uint256[2]", "uint256[2][2]", "uint256[2]"),
+    _function("registerIdentities", "uint256[8]", "uint256", "uint32", "uint256[]", "uint256"),
+    _function("unsignedInts", "uint8", "uint32", "uint128", "uint256"),
+    _function("signedInts", "int8", "int64", "int256"),
+    _function("addressAndBool", "address", "bool", "address[3]"),
+    _function("fixedBytes", "bytes1", "bytes4", "bytes20", "bytes32"),
+    _function("nestedArrays", "int16[3][2]", "bytes8[2]", "bool[2][1][2]"),
+    _function("dynamicBytes", "bytes", "uint256"),
+    _function("dynamicString", "string"),
+    _function("withTuple", "(uint256,address)", "uint256"),
+]
+
+_SELECTOR_TABLE = build_selector_table(TEST_ABI)
+_WORD_TYPE = re.compile(r"(uint|int|address|bool|bytes)(\d*)((?:\[\d+\])*)")
+
+
+def _random_value(rng, abi_type):
+    base, size, dimensions = _WORD_TYPE.fullmatch(abi_type).groups()
+    if dimensions:
+        length = int(re.findall(r"\d+", dimensions)[-1])
+        inner_type = abi_type[:abi_type.rindex("[")]
+        return tuple(_random_value(rng, inner_type) for _ in range(length))
+    if base == "uint":
+        bits = int(size or 256)
+        return rng.choice([0, (1 << bits) - 1, rng.getrandbits(bits)])
+    if base == "int":
+        bits = int(size or 256)
+        return rng.choice([-(1 << (bits - 1)), (1 << (bits - 1)) - 1, -1, rng.getrandbits(bits - 1)])
+    if base == "address":
+        return "0x" + rng.getrandbits(160).to_bytes(20, "big").hex()
+    if base == "bool":
+        return rng.choice([True, False])
+    return rng.getrandbits(8 * int(size)).to_bytes(int(size), "big")
+
+
+def _static_functions():
+    return [entry for entry in _SELECTOR_TABLE.values() if _static_decoder(entry[1]) is not None]
+
+
+def test_every_single_word_function_takes_the_static_path():
+    static_names = {fn_name for fn_name, _, _ in _static_functions()}
+    assert static_names == {"transitState", "unsignedInts", "signedInts", "addressAndBool", "fixedBytes", "nestedArrays"}
+
+
+@pytest.mark.parametrize("fn_name", ["registerIdentities", "dynamicBytes", "dynamicString", "withTuple"])
+def test_dynamic_and_tuple_arguments_fall_back_to_eth_abi(fn_name):
+    (types,) = [types for name, types, _ in _SELECTOR_TABLE.values() if name == fn_name]
+    assert _static_decoder(types) is None
+
+
+@pytest.mark.parametrize("fn_name, types, names", _static_functions(), ids=[entry[0] for entry in _static_functions()])
+def test_static_decoder_matches_eth_abi(fn_name, types, names):
+    rng = random.Random(fn_name)
+    for _ in range(50):
+        values = tuple(_random_value(rng, abi_type) for abi_type in types)
+        encoded = abi_encode(list(types), list(values))
+        assert _static_decoder(types)(encoded) == abi_decode(list(types), encoded)
+
+
+def test_decode_transaction_input_matches_eth_abi_for_every_function():
+    rng = random.Random(0)
+    for fn_name, types, names in _SELECTOR_TABLE.values():
+        if fn_name == "dynamicString":
+            values = ["hello"]
+        elif fn_name == "dynamicBytes":
+            values = [b"\x01\x02\x03", 7]
+        elif fn_name == "withTuple":
+            values = [(5, "0x" + "22" * 20), 9]
+        elif fn_name == "registerIdentities":
+            values = [tuple(range(8)), 1, 2, [3, 4, 5], 6]
+        else:
+            values = [_random_value(rng, abi_type) for abi_type in types]
+        signature = f"{fn_name}({','.join(types)})"
+        input_data = function_signature_to_4byte_selector(signature) + abi_encode(list(types), values)
+
+        decoded = decode_transaction_input(_SELECTOR_TABLE, input_data, CONTRACT_ADDRESS)
+
+        assert decoded == (fn_name, dict(zip(names, abi_decode(list(types), input_data[4:]))))
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+@pytest.mark.parametrize("types, encoded", [
+    (("bool",), _word(2)),
+    (("bool",), _word(1 << 255)),
+    (("address",), _word(1 << 160)),
+    (("uint8",), _word(256)),
+    (("uint32",), _word(1 << 40)),
+    (("int8",), _word(128)),
+    (("int8",), (-129).to_bytes(32, "big", signed=True)),
+    (("bytes4",), b"\x01\x02\x03\x04\x05" + bytes(27)),
+    (("bytes1",), b"\x01" + bytes(30) + b"\x01"),
+    (("uint256[2]",), _word(1)),
+])
+def test_malformed_words_are_rejected_like_eth_abi(types, encoded):
+    with pytest.raises(ValueError):
+        _static_decoder(types)(encoded)
+    with pytest.raises(Exception):
+        abi_decode(list(types), encoded)
+
+
+def test_malformed_input_is_not_decoded():
+    (selector,) = [selector for selector, (name, _, _) in _SELECTOR_TABLE.items() if name == "addressAndBool"]
+    input_data = selector + _word(1 << 160) + _word(1) + bytes(96)
+    assert decode_transaction_input(_SELECTOR_TABLE, input_data, CONTRACT_ADDRESS) is None